@@ -0,0 +1,41 @@
+"""msgspec-backed JSON request decoding for the API routes.
+
+FastAPI parses request bodies with stdlib json.loads before pydantic
+validation. Routing through msgspec's C decoder skips the intermediate
+str decode and is several times faster on the hot /ai/browse path.
+"""
+
+import json
+from collections.abc import Callable, Coroutine
+from typing import Any
+
+import msgspec
+from fastapi import Request, Response
+from fastapi.routing import APIRoute
+
+_DECODER = msgspec.json.Decoder()
+
+
+class _MsgspecRequest(Request):
+    async def json(self) -> Any:
+        if not hasattr(self, "_json"):
+            body = await self.body()
+            try:
+                self._json = _DECODER.decode(body)
+            except msgspec.DecodeError as e:
+                # FastAPI turns JSONDecodeError into a 422 validation error;
+                # keep that contract instead of surfacing a 500.
+                raise json.JSONDecodeError(str(e), body.decode(errors="replace"), 0) from e
+        return self._json
+
+
+class MsgspecRoute(APIRoute):
+    """APIRoute whose requests decode JSON bodies via msgspec."""
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        handler = super().get_route_handler()
+
+        async def custom_route_handler(request: Request) -> Response:
+            return await handler(_MsgspecRequest(request.scope, request.receive))
+
+        return custom_route_handler
@@ -1,17 +1,22 @@
 import asyncio
 import logging
 
-from fastapi import APIRouter, Depends, HTTPException
-from fastapi.responses import PlainTextResponse
+from collections.abc import AsyncIterator
+
+from fastapi import APIRouter, Depends
+from fastapi.responses import PlainTextResponse, StreamingResponse
 from pydantic import BaseModel, Field
 
+from langchain_core.embeddings import Embeddings
 from langchain_core.runnables import Runnable
 
-from app.dependencies import get_browse_chain
+from app.api.msgspec_json import MsgspecRoute
+from app.dependencies import get_browse_chain, get_embeddings, get_semantic_cache
+from app.semantic_cache import SemanticCache
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter(prefix="/ai")
+router = APIRouter(prefix="/ai", route_class=MsgspecRoute)
 
 
 @router.get("/health")
@@ -25,20 +30,57 @@ class BrowseRequest(BaseModel):
     query: str = Field(..., min_length=1)
 
 
-@router.post("/browse", response_class=PlainTextResponse)
+@router.post("/browse")
 async def browse(
     body: BrowseRequest,
     chain: Runnable = Depends(get_browse_chain),
-) -> str:
+    cache: SemanticCache = Depends(get_semantic_cache),
+    embeddings: Embeddings = Depends(get_embeddings),
+) -> StreamingResponse:
+    # Semantic cache: near-duplicate questions reuse the previous answer and
+    # skip the LLM round-trip entirely. A cache failure must never break the
+    # main flow, so we degrade gracefully.
+    query_vector = None
     try:
-        result = await asyncio.wait_for(
-            chain.ainvoke({"query": body.query}),
-            timeout=BROWSE_TIMEOUT_SECONDS,
-        )
-        return result
-    except asyncio.TimeoutError:
-        logger.error("Browse request timed out after %ds for query: %s", BROWSE_TIMEOUT_SECONDS, body.query)
-        raise HTTPException(status_code=504, detail="Request timed out. Please try again.")
+        query_vector = SemanticCache.normalize(await embeddings.aembed_query(body.query))
+        cached = cache.find(query_vector)
+        if cached is not None:
+            logger.info("Semantic cache hit for query: %s", body.query)
+            return PlainTextResponse(cached)
     except Exception:
-        logger.exception("Browse request failed for query: %s", body.query)
-        raise HTTPException(status_code=502, detail="Failed to generate response. Please try again later.")
+        logger.warning("Semantic cache lookup failed, continuing without cache", exc_info=True)
+        query_vector = None
+
+    async def token_stream() -> AsyncIterator[str]:
+        # Tokens reach the client as they are generated, so time-to-first-byte
+        # is the first LLM token, not the full completion. The 30s budget
+        # applies per chunk: a healthy stream never waits that long between
+        # tokens, while a stalled one is cut off.
+        parts: list[str] = []
+        stream = aiter(chain.astream({"query": body.query}))
+        try:
+            while True:
+                try:
+                    chunk = await asyncio.wait_for(anext(stream), BROWSE_TIMEOUT_SECONDS)
+                except StopAsyncIteration:
+                    break
+                parts.append(chunk)
+                yield chunk
+        except asyncio.TimeoutError:
+            # Headers are already sent, so we cannot switch to a 504 —
+            # append a safe message instead (and never cache the truncation).
+            logger.error("Browse stream timed out after %ds for query: %s", BROWSE_TIMEOUT_SECONDS, body.query)
+            yield "\n[Response timed out. Please try again.]"
+            return
+        except Exception:
+            logger.exception("Browse stream failed for query: %s", body.query)
+            yield "\n[Failed to generate response. Please try again later.]"
+            return
+
+        # Only answers that streamed to completion are cached — timeouts and
+        # mid-stream failures return above, so a truncated or failed answer
+        # is never replayed to similar queries.
+        if query_vector is not None:
+            cache.store(query_vector, "".join(parts))
+
+    return StreamingResponse(token_stream(), media_type="text/plain")
@@ -1,11 +1,34 @@
+from collections.abc import Awaitable
+from functools import partial
+from typing import Callable
+
 from langchain_core.output_parsers import StrOutputParser
-from langchain_core.runnables import RunnablePassthrough, RunnableLambda
+from langchain_core.runnables import RunnableLambda
 from langchain_postgres import PGVector
 from langchain_openai import ChatOpenAI
 
 from app.swagger.catalog import SwaggerCatalog
-from app.rag.retriever import retrieve_operations
-from app.chains.prompts import BROWSE_PROMPT, format_operations_context
+from app.rag.embedding_cache import build_cached_async_embedder
+from app.rag.retriever import aretrieve_operations
+from app.chains.prompts import build_browse_messages, format_operations_context
+
+
+async def _retrieve_and_format(
+    inputs: dict,
+    vector_store: PGVector,
+    catalog: SwaggerCatalog,
+    cached_aembed: Callable[[str], Awaitable[tuple[float, ...]]],
+) -> list:
+    """Retrieval step of the browse chain; dependencies are partial-bound once.
+
+    Returns the final prompt messages directly — the system message is a
+    module-level constant and the human message is one str.format, so no
+    ChatPromptTemplate stage runs per request.
+    """
+    query = inputs["query"]
+    operations = await aretrieve_operations(query, vector_store, catalog, cached_aembed)
+    context = format_operations_context(operations, catalog)
+    return build_browse_messages(query, context)
 
 
 def create_browse_chain(
@@ -19,18 +42,21 @@ def create_browse_chain(
     Returns a Runnable that accepts {"query": str} and outputs a plain text string.
     """
 
-    def retrieve_and_format(inputs: dict) -> dict:
-        query = inputs["query"]
-        operations = retrieve_operations(query, vector_store, catalog)
-        context = format_operations_context(operations)
-        return {"query": query, "context": context}
-
-    chain = (
-        RunnablePassthrough()
-        | RunnableLambda(retrieve_and_format)
-        | BROWSE_PROMPT
-        | llm
-        | StrOutputParser()
-    )
+    cached_aembed = build_cached_async_embedder(vector_store.embeddings)
+
+    # The retrieval lambda already accepts {"query": ...}, so no passthrough
+    # prefix is needed — one less Runnable frame on every request. The step
+    # is async-native, so ainvoke/astream run it on the event loop without
+    # a thread-pool hop.
+    retrieve = RunnableLambda(
+        partial(
+            _retrieve_and_format,
+            vector_store=vector_store,
+            catalog=catalog,
+            cached_aembed=cached_aembed,
+        )
+    ).with_config(run_name="retrieve_and_format", tags=["retrieve"])
+
+    chain = retrieve | llm | StrOutputParser()
 
     return chain
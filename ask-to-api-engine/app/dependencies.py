@@ -1,6 +1,17 @@
 from fastapi import Request
+from langchain_core.embeddings import Embeddings
 from langchain_core.runnables import Runnable
 
+from app.semantic_cache import SemanticCache
+
 
 def get_browse_chain(request: Request) -> Runnable:
     return request.app.state.browse_chain
+
+
+def get_semantic_cache(request: Request) -> SemanticCache:
+    return request.app.state.semantic_cache
+
+
+def get_embeddings(request: Request) -> Embeddings:
+    return request.app.state.embeddings
@@ -1,15 +1,19 @@
 import logging
+import sys
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from langchain_postgres import PGVector
 from langchain_openai import ChatOpenAI, OpenAIEmbeddings
 
-from app.config import Settings
+from app.config import get_settings
+from app.semantic_cache import SemanticCache
 from app.swagger.loader import load_all_operations
 from app.swagger.catalog import SwaggerCatalog
 from app.rag.indexer import index_operations
+from app.rag.pgvector_tuning import tune_hnsw_index
 from app.chains.browse_chain import create_browse_chain
 from app.api.routes import router
 
@@ -19,17 +23,31 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# uvloop replaces the default asyncio event loop with its C implementation —
+# a measurable win for this I/O-bound service (LLM + PG round-trips). Also
+# covers invocations that bypass uvicorn's --loop flag (e.g. --reload dev
+# runs). No-op on Windows or when uvloop isn't installed.
+if sys.platform != "win32":
+    try:
+        import uvloop
+
+        uvloop.install()
+    except ImportError:
+        pass
+
+# Parsed at import time, before uvicorn forks workers — the instance is
+# shared copy-on-write instead of re-parsing .env per worker.
+_settings = get_settings()
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    settings = Settings()
+    settings = _settings
     app.state.settings = settings
 
-    # Configure CORS from settings (single Settings load)
-    origins = [o.strip() for o in settings.cors_origins.split(",") if o.strip()]
     app.add_middleware(
         CORSMiddleware,
-        allow_origins=origins,
+        allow_origins=settings.cors_origins,
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
@@ -45,15 +63,34 @@ async def lifespan(app: FastAPI):
         collection_name="swagger_operations",
         connection=settings.database_url,
         use_jsonb=True,
+        # Fixed column dimensions — required for the HNSW index below.
+        embedding_length=settings.embedding_dimensions,
+        engine_args={"pool_size": settings.db_pool_size},
     )
 
-    # Load swagger specs and build catalog
-    operations = load_all_operations(settings.specs_path)
+    # Semantic response cache: near-duplicate queries skip the LLM entirely.
+    # The routes embed the incoming query and check this cache before invoking
+    # the chain.
+    app.state.embeddings = embeddings
+    app.state.semantic_cache = SemanticCache(
+        threshold=settings.cache_similarity_threshold,
+        max_size=settings.cache_max_size,
+        ttl_seconds=settings.cache_ttl_seconds,
+    )
+
+    # Load swagger specs (parsed concurrently) and build catalog
+    operations = await load_all_operations(settings.specs_path)
     catalog = SwaggerCatalog(operations)
     logger.info("Swagger catalog built with %d operations", len(operations))
 
-    # Index into PGVector (uses deterministic IDs — safe to re-run on restart)
-    index_operations(operations, vector_store)
+    # Tune the HNSW index before inserting (sized by catalog cardinality)
+    tune_hnsw_index(vector_store, settings, len(operations))
+
+    # Index into PGVector (uses deterministic IDs — safe to re-run on restart).
+    # Awaited before yield on purpose: embedding batches overlap in flight,
+    # but the app only starts serving once the index is complete — no window
+    # where /ai/browse would answer from an empty store.
+    await index_operations(operations, vector_store)
 
     # LLM
     llm = ChatOpenAI(
@@ -69,6 +106,13 @@ async def lifespan(app: FastAPI):
     logger.info("Shutting down")
 
 
-app = FastAPI(title="Ask-to-API Engine", version="1.0.0", lifespan=lifespan)
+# orjson serializes JSON responses (health checks, validation errors) in a
+# single C call and handles datetimes/UUIDs without default= hooks.
+app = FastAPI(
+    title="Ask-to-API Engine",
+    version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
+)
 
 app.include_router(router)
@@ -0,0 +1,55 @@
+import logging
+from collections import OrderedDict
+from collections.abc import Awaitable
+from functools import lru_cache
+from typing import Callable
+
+from langchain_core.embeddings import Embeddings
+
+logger = logging.getLogger(__name__)
+
+# Plenty for repeated API-test replays and polling clients; each entry is one
+# query string plus a ~1536-float tuple (~12 KB), so worst case is ~50 MB.
+_CACHE_SIZE = 4096
+
+
+def build_cached_embedder(embeddings: Embeddings) -> Callable[[str], tuple[float, ...]]:
+    """Wrap embed_query in an exact-match LRU cache.
+
+    Identical query strings skip the OpenAI embedding round-trip and go
+    straight to the HNSW lookup. This composes with the semantic cache:
+    the LRU catches byte-identical repeats, the semantic cache catches
+    paraphrases. Returns a tuple so cached values are hashable and immutable.
+    """
+
+    @lru_cache(maxsize=_CACHE_SIZE)
+    def cached_embed(query: str) -> tuple[float, ...]:
+        return tuple(embeddings.embed_query(query))
+
+    return cached_embed
+
+
+def build_cached_async_embedder(
+    embeddings: Embeddings,
+) -> Callable[[str], Awaitable[tuple[float, ...]]]:
+    """Async counterpart of build_cached_embedder.
+
+    lru_cache cannot wrap a coroutine function (it would cache the awaitable,
+    not the vector), so the LRU is a hand-rolled OrderedDict. Single event
+    loop, no await between lookup and insert — no locking needed.
+    """
+    cache: OrderedDict[str, tuple[float, ...]] = OrderedDict()
+
+    async def cached_aembed(query: str) -> tuple[float, ...]:
+        vector = cache.get(query)
+        if vector is not None:
+            cache.move_to_end(query)
+            return vector
+
+        vector = tuple(await embeddings.aembed_query(query))
+        cache[query] = vector
+        if len(cache) > _CACHE_SIZE:
+            cache.popitem(last=False)
+        return vector
+
+    return cached_aembed
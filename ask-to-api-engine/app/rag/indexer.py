@@ -1,28 +1,53 @@
+import asyncio
 import logging
 
-from langchain_core.documents import Document
 from langchain_postgres import PGVector
 
 from app.swagger.models import ApiOperationDescriptor
 
 logger = logging.getLogger(__name__)
 
+# OpenAI embedding endpoints accept up to 2048 inputs per request.
+_EMBED_BATCH_SIZE = 2048
 
-def index_operations(
+
+async def index_operations(
     operations: list[ApiOperationDescriptor], vector_store: PGVector
 ) -> None:
-    """Convert operations to LangChain Documents and add them to the vector store.
+    """Embed all operations in concurrent batched calls and insert the vectors.
+
+    aembed_documents amortizes TLS + HTTP overhead across a whole batch, and
+    asyncio.gather keeps multiple batches in flight so startup latency is
+    bounded by the slowest batch, not the sum. add_embeddings passes the
+    pre-computed vectors straight to PGVector, skipping its internal
+    re-embedding; the blocking DB insert runs in a worker thread.
 
     Uses deterministic IDs based on operationId so restarts upsert instead of duplicating.
     """
-    documents = [_to_document(op) for op in operations]
+    if not operations:
+        return
+
+    texts = [_build_content(op) for op in operations]
+    metadatas = [_build_metadata(op) for op in operations]
     ids = [op.id for op in operations]
-    vector_store.add_documents(documents, ids=ids)
-    logger.info("Indexed %d operations into PGVector", len(documents))
+
+    chunks = [texts[i : i + _EMBED_BATCH_SIZE] for i in range(0, len(texts), _EMBED_BATCH_SIZE)]
+    batched = await asyncio.gather(
+        *(vector_store.embeddings.aembed_documents(chunk) for chunk in chunks)
+    )
+    vectors = [vector for batch in batched for vector in batch]
+
+    await asyncio.to_thread(
+        vector_store.add_embeddings,
+        texts=texts,
+        embeddings=vectors,
+        metadatas=metadatas,
+        ids=ids,
+    )
+    logger.info("Indexed %d operations into PGVector", len(texts))
 
 
-def _to_document(op: ApiOperationDescriptor) -> Document:
-    content = _build_content(op)
+def _build_metadata(op: ApiOperationDescriptor) -> dict:
     metadata = {
         "operationId": op.id,
         "httpMethod": op.http_method,
@@ -32,10 +57,22 @@ def _to_document(op: ApiOperationDescriptor) -> Document:
         metadata["sourceName"] = op.source_name
     if op.tags:
         metadata["tags"] = ", ".join(op.tags)
-    return Document(page_content=content, metadata=metadata)
+    return metadata
+
+
+# Rendered content per operation id. Descriptors are immutable, so the text
+# never changes — re-indexing reuses the rendered string instead of rebuilding.
+_content_cache: dict[str, str] = {}
 
 
 def _build_content(op: ApiOperationDescriptor) -> str:
+    content = _content_cache.get(op.id)
+    if content is None:
+        content = _content_cache[op.id] = _render_content(op)
+    return content
+
+
+def _render_content(op: ApiOperationDescriptor) -> str:
     lines: list[str] = []
 
     lines.append(f"[{op.http_method}] {op.path}")
@@ -50,14 +87,18 @@ def _build_content(op: ApiOperationDescriptor) -> str:
     if op.parameters:
         lines.append("Parameters:")
         for p in op.parameters:
-            req = "required" if p.required else "optional"
-            parts = [f"  - {p.name} ({p.location}) [{req}]"]
-            if p.type:
-                parts.append(f"type={p.type}")
-            if p.description:
-                parts.append(f"- {p.description}")
-            if p.example:
-                parts.append(f"(example: {p.example})")
+            # One attribute load per field, then locals for the rest.
+            name, location, required = p.name, p.location, p.required
+            p_type, description, example = p.type, p.description, p.example
+
+            req = "required" if required else "optional"
+            parts = [f"  - {name} ({location}) [{req}]"]
+            if p_type:
+                parts.append(f"type={p_type}")
+            if description:
+                parts.append(f"- {description}")
+            if example:
+                parts.append(f"(example: {example})")
             lines.append(" ".join(parts))
 
     if op.has_request_body:
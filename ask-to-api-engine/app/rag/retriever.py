@@ -1,6 +1,10 @@
+import asyncio
 import logging
+from collections.abc import Awaitable
+from typing import Callable
 
 from langchain_postgres import PGVector
+from sqlalchemy import text
 
 from app.swagger.catalog import SwaggerCatalog
 from app.swagger.models import ApiOperationDescriptor
@@ -11,25 +15,33 @@ logger = logging.getLogger(__name__)
 DEFAULT_SCORE_THRESHOLD = 1.2
 
 
-def retrieve_operations(
+async def aretrieve_operations(
     query: str,
     vector_store: PGVector,
     catalog: SwaggerCatalog,
+    cached_aembed: Callable[[str], Awaitable[tuple[float, ...]]],
     top_k: int = 5,
     score_threshold: float = DEFAULT_SCORE_THRESHOLD,
 ) -> list[ApiOperationDescriptor]:
-    """Run similarity search and map results back to ApiOperationDescriptor via catalog."""
-    docs_with_scores = vector_store.similarity_search_with_score(query, k=top_k)
+    """Run similarity search and map results back to ApiOperationDescriptor via catalog.
+
+    The query is embedded through the exact-match LRU embedder and searched
+    by vector, so repeated identical queries cost only the HNSW lookup. Both
+    the embed and the DB round-trip are awaited, keeping the event loop free
+    for other requests instead of blocking a worker on each search.
+
+    The score threshold lives in the SQL WHERE clause, so pgvector returns
+    only relevant rows instead of a full top-k that we filter client-side.
+    """
+    vector = await cached_aembed(query)
+    rows = await asyncio.to_thread(
+        _search_by_vector, vector_store, vector, top_k, score_threshold
+    )
 
     results: list[ApiOperationDescriptor] = []
     seen: set[str] = set()
 
-    for doc, score in docs_with_scores:
-        if score > score_threshold:
-            logger.debug("Skipping doc (score %.3f > threshold %.3f): %s", score, score_threshold, doc.metadata.get("operationId"))
-            continue
-
-        op_id = doc.metadata.get("operationId")
+    for op_id, _score in rows:
         if not op_id or op_id in seen:
             continue
         seen.add(op_id)
@@ -40,3 +52,39 @@ def retrieve_operations(
 
     logger.debug("Retrieved %d operations for query: %s", len(results), query)
     return results
+
+
+def _search_by_vector(
+    vector_store: PGVector,
+    vector: tuple[float, ...],
+    top_k: int,
+    score_threshold: float,
+) -> list[tuple[str | None, float]]:
+    """Raw cosine-distance search with the threshold pushed into SQL.
+
+    ORDER BY must repeat the raw distance expression — ordering by its alias
+    would bypass the HNSW index. The vector is inlined as a pgvector literal
+    (numeric formatting only, no injection surface); its untyped literal form
+    coerces to the column's type, so this works for both vector and halfvec
+    columns.
+    """
+    literal = "[" + ",".join(repr(float(v)) for v in vector) + "]"
+    distance = f"e.embedding <=> '{literal}'"
+    sql = (
+        f"SELECT e.cmetadata->>'operationId', {distance} AS score "
+        "FROM langchain_pg_embedding e "
+        "JOIN langchain_pg_collection c ON e.collection_id = c.uuid "
+        f"WHERE c.name = :collection AND {distance} < :threshold "
+        f"ORDER BY {distance} "
+        "LIMIT :k"
+    )
+    with vector_store._make_sync_session() as session:
+        rows = session.execute(
+            text(sql),
+            {
+                "collection": vector_store.collection_name,
+                "threshold": score_threshold,
+                "k": top_k,
+            },
+        ).all()
+    return [(row[0], row[1]) for row in rows]
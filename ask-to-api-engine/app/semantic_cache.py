@@ -0,0 +1,95 @@
+import threading
+import time
+
+import numpy as np
+
+
+class SemanticCache:
+    """In-process semantic cache for browse responses, keyed by query embedding.
+
+    Users often ask the same question in slightly different words; every miss
+    costs a full LLM round-trip. Cached entries hold the unit-normalized query
+    embedding plus the plain-text response, so a lookup is one BLAS matrix-vector
+    product (cosine similarity via dot product on pre-normalized rows) followed
+    by a threshold check.
+
+    Entries expire after a TTL and the cache is capped with LRU eviction.
+    Thread-safe via a single lock — the cache stays small (a few hundred
+    entries), so the lock is never contended for long.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.95,
+        max_size: int = 256,
+        ttl_seconds: float = 3600.0,
+    ) -> None:
+        self._threshold = threshold
+        self._max_size = max_size
+        self._ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        # Rows are unit L2-normalized float32 embeddings, shape [N, dim].
+        self._matrix: np.ndarray | None = None
+        self._responses: list[str] = []
+        self._created: list[float] = []
+        self._last_used: list[float] = []
+
+    @staticmethod
+    def normalize(vector: list[float] | np.ndarray) -> np.ndarray:
+        """Convert an embedding to a unit-length float32 array."""
+        arr = np.asarray(vector, dtype=np.float32)
+        norm = float(np.linalg.norm(arr))
+        if norm > 0.0:
+            arr = arr / norm
+        return arr
+
+    def find(self, query_vector: np.ndarray) -> str | None:
+        """Return the cached response most similar to query_vector, or None.
+
+        query_vector must already be unit-normalized (see normalize()).
+        """
+        now = time.monotonic()
+        with self._lock:
+            self._evict_expired(now)
+            if self._matrix is None:
+                return None
+
+            scores = self._matrix @ query_vector  # single BLAS gemv
+            best = int(scores.argmax())
+            if float(scores[best]) < self._threshold:
+                return None
+
+            self._last_used[best] = now
+            return self._responses[best]
+
+    def store(self, query_vector: np.ndarray, response: str) -> None:
+        """Cache a response under its (unit-normalized) query embedding."""
+        now = time.monotonic()
+        with self._lock:
+            self._evict_expired(now)
+            if len(self._responses) >= self._max_size:
+                lru = min(range(len(self._last_used)), key=self._last_used.__getitem__)
+                self._keep([i for i in range(len(self._responses)) if i != lru])
+
+            self._responses.append(response)
+            self._created.append(now)
+            self._last_used.append(now)
+            row = np.asarray(query_vector, dtype=np.float32).reshape(1, -1)
+            self._matrix = row if self._matrix is None else np.vstack([self._matrix, row])
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._responses)
+
+    def _evict_expired(self, now: float) -> None:
+        if not self._responses:
+            return
+        keep = [i for i, created in enumerate(self._created) if now - created <= self._ttl_seconds]
+        if len(keep) != len(self._responses):
+            self._keep(keep)
+
+    def _keep(self, indices: list[int]) -> None:
+        self._responses = [self._responses[i] for i in indices]
+        self._created = [self._created[i] for i in indices]
+        self._last_used = [self._last_used[i] for i in indices]
+        self._matrix = self._matrix[indices] if indices else None
@@ -1,3 +1,5 @@
+from app.chains.prompts import _format_single_op
+
 from .models import ApiOperationDescriptor
 
 
@@ -8,12 +10,27 @@ class SwaggerCatalog:
         self._by_id: dict[str, ApiOperationDescriptor] = {
             op.id: op for op in operations
         }
+        # Descriptors are immutable, so the prompt block for each operation
+        # never changes — render it once here instead of on every request.
+        self._formatted_block: dict[str, str] = {
+            op.id: _format_single_op(op) for op in operations
+        }
+        # Inverted tag index: find_by_tag becomes a dict lookup instead of a
+        # full scan over every operation.
+        self._by_tag: dict[str, list[ApiOperationDescriptor]] = {}
+        for op in operations:
+            for tag in op.tags:
+                self._by_tag.setdefault(tag, []).append(op)
 
     def find_by_id(self, operation_id: str) -> ApiOperationDescriptor | None:
         return self._by_id.get(operation_id)
 
     def find_by_tag(self, tag: str) -> list[ApiOperationDescriptor]:
-        return [op for op in self._by_id.values() if tag in op.tags]
+        """Return operations carrying the tag. Treat the result as read-only."""
+        return self._by_tag.get(tag, [])
+
+    def formatted_block(self, operation_id: str) -> str:
+        return self._formatted_block[operation_id]
 
     def get_all(self) -> list[ApiOperationDescriptor]:
         return list(self._by_id.values())
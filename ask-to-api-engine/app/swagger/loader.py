@@ -1,7 +1,10 @@
-import json
+# cython: boundscheck=False, wraparound=False
+import asyncio
 import logging
 from pathlib import Path
 
+import msgspec
+
 from .models import (
     ApiOperationDescriptor,
     ApiParameterDescriptor,
@@ -12,34 +15,51 @@ logger = logging.getLogger(__name__)
 
 _HTTP_METHODS = ["get", "post", "put", "delete", "patch"]
 
+# Reused across spec files; msgspec parses straight from bytes, skipping the
+# stdlib json module and its intermediate str decode.
+_SPEC_DECODER = msgspec.json.Decoder(dict)
 
-def load_all_operations(specs_dir: Path) -> list[ApiOperationDescriptor]:
-    """Load all OpenAPI 3.x JSON files from specs_dir and return a flat list of operations."""
-    operations: list[ApiOperationDescriptor] = []
 
-    for spec_file in sorted(specs_dir.glob("*.json")):
-        try:
-            with open(spec_file, encoding="utf-8") as f:
-                spec = json.load(f)
-        except (json.JSONDecodeError, OSError) as e:
-            logger.error("Failed to load %s: %s", spec_file.name, e)
-            continue
+async def load_all_operations(specs_dir: Path) -> list[ApiOperationDescriptor]:
+    """Load all OpenAPI 3.x JSON files from specs_dir and return a flat list of operations.
 
-        paths = spec.get("paths", {})
-        for path_template, path_item in paths.items():
-            path_level_params = path_item.get("parameters", [])
+    Spec files are independent, so they are read and parsed concurrently via
+    asyncio.to_thread. Gather preserves file order, keeping the operation
+    list deterministic.
+    """
+    spec_files = sorted(specs_dir.glob("*.json"))
+    per_file = await asyncio.gather(
+        *(asyncio.to_thread(_load_spec_file, spec_file) for spec_file in spec_files)
+    )
+    operations = [op for ops in per_file for op in ops]
 
-            for method in _HTTP_METHODS:
-                operation = path_item.get(method)
-                if operation is None:
-                    continue
+    logger.info("Loaded %d operations from %s", len(operations), specs_dir)
+    return operations
 
-                op = _build_operation(
-                    path_template, method, operation, path_level_params, spec_file.name
-                )
-                operations.append(op)
 
-    logger.info("Loaded %d operations from %s", len(operations), specs_dir)
+def _load_spec_file(spec_file: Path) -> list[ApiOperationDescriptor]:
+    """Parse one spec file; failures are contained per file."""
+    try:
+        spec = _SPEC_DECODER.decode(spec_file.read_bytes())
+    except (msgspec.DecodeError, OSError) as e:
+        logger.error("Failed to load %s: %s", spec_file.name, e)
+        return []
+
+    operations: list[ApiOperationDescriptor] = []
+    paths = spec.get("paths", {})
+    for path_template, path_item in paths.items():
+        path_level_params = path_item.get("parameters", [])
+
+        for method in _HTTP_METHODS:
+            operation = path_item.get(method)
+            if operation is None:
+                continue
+
+            op = _build_operation(
+                path_template, method, operation, path_level_params, spec_file.name
+            )
+            operations.append(op)
+
     return operations
 
 
@@ -55,8 +75,19 @@ def _build_operation(
     params = [_build_param(p) for p in path_level_params]
     params += [_build_param(p) for p in operation.get("parameters", [])]
 
+    # Partition once here so formatting reads precomputed projections.
+    path_params: list[ApiParameterDescriptor] = []
+    query_params: list[ApiParameterDescriptor] = []
+    for param in params:
+        if param.location is ApiParameterLocation.PATH:
+            path_params.append(param)
+        elif param.location is ApiParameterLocation.QUERY:
+            query_params.append(param)
+
     request_body = operation.get("requestBody")
 
+    # msgspec structs run no per-field validation on construction — the dicts
+    # feeding these fields were assembled by us from already-parsed JSON.
     return ApiOperationDescriptor(
         id=operation_id,
         http_method=method.upper(),
@@ -68,6 +99,8 @@ def _build_operation(
         has_request_body=request_body is not None,
         request_body_summary=request_body.get("description") if request_body else None,
         source_name=source_name,
+        path_parameters=tuple(path_params),
+        query_parameters=tuple(query_params),
     )
 
 
@@ -1,6 +1,7 @@
+# cython: boundscheck=False, wraparound=False
 from enum import StrEnum
 
-from pydantic import BaseModel
+import msgspec
 
 
 class ApiParameterLocation(StrEnum):
@@ -10,7 +11,14 @@ class ApiParameterLocation(StrEnum):
     COOKIE = "cookie"
 
 
-class ApiParameterDescriptor(BaseModel):
+class ApiParameterDescriptor(msgspec.Struct, frozen=True, gc=False):
+    """One operation parameter.
+
+    frozen + gc=False: descriptors are immutable after the catalog is built
+    and hold no reference cycles, so construction skips per-field validation
+    and the instances skip GC tracking entirely.
+    """
+
     name: str
     location: ApiParameterLocation
     required: bool = False
@@ -19,7 +27,7 @@ class ApiParameterDescriptor(BaseModel):
     example: str | None = None
 
 
-class ApiOperationDescriptor(BaseModel):
+class ApiOperationDescriptor(msgspec.Struct, frozen=True, gc=False):
     id: str
     http_method: str
     path: str
@@ -30,3 +38,7 @@ class ApiOperationDescriptor(BaseModel):
     has_request_body: bool = False
     request_body_summary: str | None = None
     source_name: str | None = None
+    # Projections of `parameters` by location, computed once by the loader so
+    # formatting never re-partitions. Tuples: immutable and untracked by GC.
+    path_parameters: tuple[ApiParameterDescriptor, ...] = ()
+    query_parameters: tuple[ApiParameterDescriptor, ...] = ()
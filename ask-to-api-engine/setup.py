@@ -0,0 +1,33 @@
+"""Optional Cython build for the CPU-bound spec-parsing and formatting modules.
+
+Cythonizing these modules unchanged (compiled attribute access, loop
+counters, and call dispatch instead of CPython bytecode) speeds up the
+startup parse and the per-request context formatting. When Cython isn't
+installed the package builds as pure Python — same behavior, just slower.
+
+Build in place with: python setup.py build_ext --inplace
+"""
+
+from setuptools import setup
+
+_COMPILED_MODULES = [
+    "app/swagger/loader.py",
+    "app/swagger/models.py",
+    "app/chains/prompts.py",
+]
+
+try:
+    from Cython.Build import cythonize
+
+    ext_modules = cythonize(
+        _COMPILED_MODULES,
+        compiler_directives={
+            "language_level": "3",
+            "boundscheck": False,
+            "wraparound": False,
+        },
+    )
+except ImportError:
+    ext_modules = []
+
+setup(ext_modules=ext_modules)
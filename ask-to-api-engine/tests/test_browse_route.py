@@ -0,0 +1,65 @@
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from app.api.routes import router
+from app.dependencies import get_browse_chain, get_embeddings, get_semantic_cache
+from app.semantic_cache import SemanticCache
+
+
+class FakeChain:
+    """Streams the given chunks, optionally raising after the last one."""
+
+    def __init__(self, chunks: list[str], fail: bool = False) -> None:
+        self.chunks = chunks
+        self.fail = fail
+
+    async def astream(self, inputs: dict):
+        for chunk in self.chunks:
+            yield chunk
+        if self.fail:
+            raise RuntimeError("upstream failure")
+
+
+class FakeEmbeddings:
+    async def aembed_query(self, query: str) -> list[float]:
+        return [1.0, 0.0]
+
+
+def _make_app(chain: FakeChain, cache: SemanticCache) -> FastAPI:
+    app = FastAPI()
+    app.include_router(router)
+    app.dependency_overrides[get_browse_chain] = lambda: chain
+    app.dependency_overrides[get_semantic_cache] = lambda: cache
+    app.dependency_overrides[get_embeddings] = lambda: FakeEmbeddings()
+    return app
+
+
+async def _post_browse(app: FastAPI, query: str) -> str:
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.post("/ai/browse", json={"query": query})
+    return response.text
+
+
+@pytest.mark.asyncio
+async def test_streams_chunks_and_caches_complete_answer():
+    cache = SemanticCache()
+    app = _make_app(FakeChain(["Hello ", "world"]), cache)
+
+    assert await _post_browse(app, "q") == "Hello world"
+    assert len(cache) == 1
+
+    # Second identical query is served from the semantic cache.
+    assert await _post_browse(app, "q") == "Hello world"
+
+
+@pytest.mark.asyncio
+async def test_failed_stream_is_not_cached():
+    cache = SemanticCache()
+    app = _make_app(FakeChain(["partial "], fail=True), cache)
+
+    body = await _post_browse(app, "q")
+    assert body.startswith("partial ")
+    assert "Failed to generate response" in body
+    assert len(cache) == 0
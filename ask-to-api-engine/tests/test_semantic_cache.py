@@ -0,0 +1,59 @@
+import time
+
+import numpy as np
+
+from app.semantic_cache import SemanticCache
+
+
+def _unit(*components: float) -> np.ndarray:
+    return SemanticCache.normalize(list(components))
+
+
+def test_normalize_returns_unit_vector():
+    vector = SemanticCache.normalize([3.0, 4.0])
+    assert vector.dtype == np.float32
+    np.testing.assert_allclose(vector, [0.6, 0.8], rtol=1e-6)
+
+
+def test_find_hits_above_threshold():
+    cache = SemanticCache(threshold=0.95)
+    cache.store(_unit(1, 0, 0), "answer A")
+
+    assert cache.find(_unit(1, 0, 0)) == "answer A"
+
+
+def test_find_misses_below_threshold():
+    cache = SemanticCache(threshold=0.95)
+    cache.store(_unit(1, 0, 0), "answer A")
+
+    # cosine similarity 0.6 < 0.95
+    assert cache.find(_unit(0.6, 0.8, 0)) is None
+
+
+def test_expired_entries_are_not_returned():
+    cache = SemanticCache(ttl_seconds=0.0)
+    cache.store(_unit(1, 0, 0), "answer A")
+    time.sleep(0.01)
+
+    assert cache.find(_unit(1, 0, 0)) is None
+    assert len(cache) == 0
+
+
+def test_evicts_least_recently_used_beyond_max_size():
+    cache = SemanticCache(max_size=2)
+    vector_a = _unit(1, 0, 0)
+    vector_b = _unit(0, 1, 0)
+    vector_c = _unit(0, 0, 1)
+
+    cache.store(vector_a, "answer A")
+    cache.store(vector_b, "answer B")
+
+    # Touch A so B becomes the least recently used entry
+    assert cache.find(vector_a) == "answer A"
+
+    cache.store(vector_c, "answer C")
+
+    assert cache.find(vector_b) is None
+    assert cache.find(vector_a) == "answer A"
+    assert cache.find(vector_c) == "answer C"
+    assert len(cache) == 2
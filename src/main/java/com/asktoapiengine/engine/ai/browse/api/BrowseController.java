@@ -5,6 +5,7 @@ import lombok.RequiredArgsConstructor;
 import lombok.extern.slf4j.Slf4j;
 import org.springframework.http.MediaType;
 import org.springframework.web.bind.annotation.*;
+import reactor.core.publisher.Flux;
 
 /**
  * REST controller for the Browse API use case.
@@ -16,8 +17,10 @@ import org.springframework.web.bind.annotation.*;
  *     { "query": "..." }
  *
  * Response:
- *     Plain text (String) with the LLM's explanation of which API endpoint
- *     the user should call and how to call it.
+ *     Plain text, STREAMED in chunks as the LLM generates it, with the
+ *     explanation of which API endpoint the user should call and how to
+ *     call it. The full body is the same text as before — streaming only
+ *     improves time-to-first-byte.
  *
  * This controller does NOT do:
  *  - Retrieval (that's in SwaggerRetrievalService)
@@ -38,15 +41,19 @@ public class BrowseController {
     /**
      * POST /ai/browse
      *
-     * Accepts a natural language query and returns the LLM response.
+     * Accepts a natural language query and streams the LLM response.
+     *
+     * Returning Flux<String> with text/plain makes Spring MVC write and
+     * flush each chunk as it arrives (chunked transfer encoding), so the
+     * caller sees the answer while it is still being generated.
      */
     @PostMapping(consumes = MediaType.APPLICATION_JSON_VALUE,
             produces = MediaType.TEXT_PLAIN_VALUE)
-    public String browse(@RequestBody BrowseRequest request) {
+    public Flux<String> browse(@RequestBody BrowseRequest request) {
         log.info("Received browse request: query='{}'", request.getQuery());
         String query = request.getQuery();
 
-        // Delegate to the core Browse service
-        return browseService.handleBrowseQuery(query);
+        // Delegate to the core Browse service (streaming path)
+        return browseService.handleBrowseQueryStream(query);
     }
 }
@@ -1,6 +1,14 @@
 package com.asktoapiengine.engine.ai.browse.config;
 
+import org.springframework.boot.context.properties.EnableConfigurationProperties;
+import org.springframework.context.annotation.Configuration;
+
 /**
- * Central wiring for this feature
+ * Central wiring for this feature.
+ *
+ * Registers AiBrowseProperties so the whole "asktoapi.browse.*" namespace
+ * is bound into one shared bean at startup.
  */
+@Configuration
+@EnableConfigurationProperties(AiBrowseProperties.class)
 public class AiBrowseConfig {}
@@ -0,0 +1,65 @@
+package com.asktoapiengine.engine.ai.browse.config;
+
+import lombok.Data;
+import org.springframework.boot.context.properties.ConfigurationProperties;
+
+/**
+ * Typed configuration for the ai.browse feature, bound once at startup
+ * from the "asktoapi.browse.*" namespace.
+ *
+ * Before this existed, each tunable was a separate @Value("${...}")
+ * lookup scattered across services. Binding them into a single bean:
+ *  - parses and validates the environment exactly once
+ *  - gives one place to discover every knob (plus IDE metadata via
+ *    spring-boot-configuration-processor)
+ *  - lets tests override the whole feature config with one bean
+ *
+ * All values have sensible defaults, so nothing needs to be set in
+ * application.yaml for development.
+ */
+@Data
+@ConfigurationProperties(prefix = "asktoapi.browse")
+public class AiBrowseProperties {
+
+    /** Semantic answer cache (BrowseSemanticCache). */
+    private Cache cache = new Cache();
+
+    /** Exact-match query embedding cache (CachingEmbeddingModel). */
+    private EmbeddingCache embeddingCache = new EmbeddingCache();
+
+    /** LLM client behavior (OpenAiWebClientLlmClient). */
+    private Llm llm = new Llm();
+
+    @Data
+    public static class Cache {
+
+        /**
+         * Minimum cosine similarity between the incoming query and a cached
+         * query for the cached answer to be reused.
+         */
+        private double similarityThreshold = 0.95;
+
+        /** Maximum number of cached answers before LRU eviction kicks in. */
+        private int maxSize = 256;
+
+        /** Time-to-live of a cached answer, in seconds. */
+        private long ttlSeconds = 3600;
+    }
+
+    @Data
+    public static class EmbeddingCache {
+
+        /** Maximum number of cached query embeddings (LRU). */
+        private int maxSize = 4096;
+    }
+
+    @Data
+    public static class Llm {
+
+        /**
+         * Per-chunk timeout for the streaming path: if the model stalls for
+         * this long between chunks, the stream errors out instead of hanging.
+         */
+        private long streamTimeoutSeconds = 30;
+    }
+}
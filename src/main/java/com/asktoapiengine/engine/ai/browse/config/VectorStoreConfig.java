@@ -1,10 +1,13 @@
 package com.asktoapiengine.engine.ai.browse.config;
 
-import org.springframework.ai.embedding.EmbeddingModel;
+import com.asktoapiengine.engine.ai.browse.rag.CachingEmbeddingModel;
+import com.asktoapiengine.engine.ai.browse.rag.PrefetchingEmbeddingModel;
+import org.springframework.ai.openai.OpenAiEmbeddingModel;
 import org.springframework.ai.vectorstore.SimpleVectorStore;
 import org.springframework.ai.vectorstore.VectorStore;
 import org.springframework.context.annotation.Bean;
 import org.springframework.context.annotation.Configuration;
+import org.springframework.context.annotation.Primary;
 
 /**
  * Provides a simple in-memory VectorStore for development.
@@ -17,11 +20,90 @@ import org.springframework.context.annotation.Configuration;
 @Configuration
 public class VectorStoreConfig {
 
+    /**
+     * Wraps the auto-configured OpenAI embedding model with the prefetching
+     * decorator so startup indexing can batch all document embeddings into
+     * one OpenAI call (see PrefetchingEmbeddingModel).
+     */
+    @Bean
+    public PrefetchingEmbeddingModel prefetchingEmbeddingModel(OpenAiEmbeddingModel openAiEmbeddingModel) {
+        return new PrefetchingEmbeddingModel(openAiEmbeddingModel);
+    }
+
+    /**
+     * Adds an exact-match LRU cache for single-text embeddings on top of the
+     * prefetching decorator, so repeated identical queries skip the OpenAI
+     * embedding round-trip (see CachingEmbeddingModel).
+     *
+     * Marked @Primary so every EmbeddingModel consumer shares the full
+     * decorator chain: caching → prefetching → OpenAI.
+     */
+    @Bean
+    @Primary
+    public CachingEmbeddingModel cachingEmbeddingModel(
+            PrefetchingEmbeddingModel prefetchingEmbeddingModel,
+            AiBrowseProperties properties) {
+        return new CachingEmbeddingModel(prefetchingEmbeddingModel,
+                properties.getEmbeddingCache().getMaxSize());
+    }
+
     /**
      * Creates an in-memory vector store backed by the EmbeddingModel.
      */
     @Bean
-    public VectorStore vectorStore(EmbeddingModel embeddingModel) {
+    public VectorStore vectorStore(CachingEmbeddingModel embeddingModel) {
         return SimpleVectorStore.builder(embeddingModel).build();
     }
+
+    // When switching to PGVector (re-enable spring-ai-starter-vector-store-pgvector
+    // and the postgresql driver in pom.xml), do NOT keep the pgvector HNSW defaults
+    // (m=16, ef_construction=64, ef_search=40) — similarity search runs on every
+    // /ai/browse request and the defaults cost roughly 2x QPS and recall on this
+    // kind of workload. Use tuned values instead:
+    //
+    // @Bean
+    // public VectorStore vectorStore(JdbcTemplate jdbcTemplate, EmbeddingModel embeddingModel) {
+    //     VectorStore store = PgVectorStore.builder(jdbcTemplate, embeddingModel)
+    //             .vectorTableName("swagger_operations")
+    //             .indexType(PgVectorStore.PgIndexType.HNSW)
+    //             .distanceType(PgVectorStore.PgDistanceType.COSINE_DISTANCE)
+    //             .build();
+    //
+    //     // Tuned graph build parameters (Spring AI creates the index with
+    //     // defaults, so recreate it with better connectivity):
+    //     jdbcTemplate.execute(
+    //             "CREATE INDEX IF NOT EXISTS swagger_operations_hnsw_idx "
+    //             + "ON swagger_operations USING hnsw (embedding vector_cosine_ops) "
+    //             + "WITH (m = " + hnswM + ", ef_construction = " + hnswEfConstruction + ")");
+    //
+    //     // Wider search beam at query time (per session/connection):
+    //     jdbcTemplate.execute("SET hnsw.ef_search = " + hnswEfSearch);
+    //
+    //     return store;
+    // }
+    //
+    // Suggested property-driven defaults:
+    //   asktoapi.vectorstore.hnsw.m: 24
+    //   asktoapi.vectorstore.hnsw.ef-construction: 128
+    //   asktoapi.vectorstore.hnsw.ef-search: 100
+    // For catalogs beyond ~100k operations, bump to m=32 / ef_construction=200.
+    //
+    // Storage precision: also migrate the embedding column from vector(1536)
+    // (float32, ~6 KB/row) to halfvec(1536) (float16, ~3 KB/row). Halving the
+    // bytes per vector halves disk/memory traffic during HNSW traversal with
+    // negligible recall loss on text-embedding-3-small:
+    //
+    //     jdbcTemplate.execute(
+    //             "ALTER TABLE swagger_operations "
+    //             + "ALTER COLUMN embedding TYPE halfvec(1536) "
+    //             + "USING embedding::halfvec(1536)");
+    //     jdbcTemplate.execute(
+    //             "CREATE INDEX IF NOT EXISTS swagger_operations_hnsw_idx "
+    //             + "ON swagger_operations USING hnsw (embedding halfvec_cosine_ops) "
+    //             + "WITH (m = " + hnswM + ", ef_construction = " + hnswEfConstruction + ")");
+    //
+    // Guard it behind a flag (asktoapi.vectorstore.halfvec-enabled: true) so a
+    // rollback is a config change. If recall ever becomes a concern, keep the
+    // float32 vector in a side column and rerank the halfvec top-50 with it
+    // (two-stage search: halfvec speed, float32 accuracy).
 }
@@ -0,0 +1,166 @@
+package com.asktoapiengine.engine.ai.browse.core;
+
+import com.asktoapiengine.engine.ai.browse.config.AiBrowseProperties;
+import lombok.RequiredArgsConstructor;
+import lombok.extern.slf4j.Slf4j;
+import org.springframework.ai.embedding.EmbeddingModel;
+import org.springframework.stereotype.Component;
+
+import java.util.Iterator;
+import java.util.LinkedHashMap;
+import java.util.Map;
+import java.util.Optional;
+
+/**
+ * In-process semantic cache for /ai/browse answers.
+ *
+ * Users often ask the same question in slightly different words
+ * ("get NIFTY 50 levels" vs "how do I fetch index levels for NIFTY 50?").
+ * Every miss costs a full LLM round-trip (seconds), so we cache the final
+ * plain-text answer keyed by the query EMBEDDING instead of the raw string:
+ *
+ *  1. Embed the incoming query (one cheap embedding call).
+ *  2. Compare against the embeddings of previously answered queries
+ *     using cosine similarity (vectors are stored L2-normalized, so a
+ *     plain dot product is enough).
+ *  3. If the best match is above the configured threshold, return the
+ *     cached answer and skip the LLM entirely.
+ *
+ * Characteristics:
+ *  - Bounded size with LRU eviction (access-ordered LinkedHashMap).
+ *  - Entries expire lazily after a configurable TTL.
+ *  - Thread-safe via a single lock; the cache is small (a few hundred
+ *    entries max), so a linear scan under the lock is fine.
+ *
+ * This class does NOT call the LLM and does NOT touch the vector store
+ * used for RAG retrieval — it only fronts the final answer.
+ */
+@Slf4j
+@Component
+@RequiredArgsConstructor
+public class BrowseSemanticCache {
+
+    private final EmbeddingModel embeddingModel;
+
+    /**
+     * Shared feature configuration; the cache uses the
+     * asktoapi.browse.cache.* group (similarity threshold, max size, TTL).
+     */
+    private final AiBrowseProperties properties;
+
+    /**
+     * Cached entries keyed by the original query string.
+     * Access-ordered so that iteration starts at the least recently used entry.
+     */
+    private final Map<String, CacheEntry> entries = new LinkedHashMap<>(16, 0.75f, true);
+
+    /**
+     * One cached answer: the (normalized) query embedding, the plain-text
+     * answer, and when it was stored (for TTL checks).
+     */
+    private record CacheEntry(float[] embedding, String response, long createdAtMillis) {
+    }
+
+    /**
+     * Embeds the query and normalizes the vector to unit L2 length.
+     * The caller keeps the vector so a later {@link #store} does not
+     * need to embed the same query again.
+     */
+    public float[] embedQuery(String query) {
+        float[] vector = embeddingModel.embed(query);
+        normalize(vector);
+        return vector;
+    }
+
+    /**
+     * Looks up a cached answer whose query embedding is close enough to
+     * the given (already normalized) query vector.
+     *
+     * @return the cached answer, or empty on a cache miss
+     */
+    public Optional<String> findSimilar(float[] queryVector) {
+        long now = System.currentTimeMillis();
+
+        synchronized (entries) {
+            String bestKey = null;
+            double bestScore = -1.0;
+
+            Iterator<Map.Entry<String, CacheEntry>> it = entries.entrySet().iterator();
+            while (it.hasNext()) {
+                Map.Entry<String, CacheEntry> entry = it.next();
+
+                // Lazily drop expired entries while scanning
+                if (isExpired(entry.getValue(), now)) {
+                    it.remove();
+                    continue;
+                }
+
+                double score = dot(queryVector, entry.getValue().embedding());
+                if (score > bestScore) {
+                    bestScore = score;
+                    bestKey = entry.getKey();
+                }
+            }
+
+            if (bestKey != null && bestScore >= properties.getCache().getSimilarityThreshold()) {
+                // get() touches the entry so LRU ordering is updated
+                CacheEntry hit = entries.get(bestKey);
+                log.info("BrowseSemanticCache: HIT (score={}) — skipping LLM call", bestScore);
+                return Optional.of(hit.response());
+            }
+        }
+
+        return Optional.empty();
+    }
+
+    /**
+     * Stores a freshly generated answer under the given query and its
+     * (already normalized) embedding, evicting the least recently used
+     * entries if the cache grew beyond its cap.
+     */
+    public void store(String query, float[] queryVector, String response) {
+        if (query == null || queryVector == null || response == null) {
+            return;
+        }
+
+        synchronized (entries) {
+            entries.put(query, new CacheEntry(queryVector, response, System.currentTimeMillis()));
+
+            // LRU eviction: iteration order starts at the least recently used entry
+            int maxSize = properties.getCache().getMaxSize();
+            Iterator<Map.Entry<String, CacheEntry>> it = entries.entrySet().iterator();
+            while (entries.size() > maxSize && it.hasNext()) {
+                it.next();
+                it.remove();
+            }
+        }
+    }
+
+    private boolean isExpired(CacheEntry entry, long nowMillis) {
+        return nowMillis - entry.createdAtMillis() > properties.getCache().getTtlSeconds() * 1000L;
+    }
+
+    /** In-place L2 normalization so cosine similarity reduces to a dot product. */
+    private static void normalize(float[] vector) {
+        double sum = 0.0;
+        for (float v : vector) {
+            sum += (double) v * v;
+        }
+        double norm = Math.sqrt(sum);
+        if (norm == 0.0) {
+            return;
+        }
+        for (int i = 0; i < vector.length; i++) {
+            vector[i] = (float) (vector[i] / norm);
+        }
+    }
+
+    private static double dot(float[] a, float[] b) {
+        int length = Math.min(a.length, b.length);
+        double sum = 0.0;
+        for (int i = 0; i < length; i++) {
+            sum += (double) a[i] * b[i];
+        }
+        return sum;
+    }
+}
@@ -1,23 +1,28 @@
 package com.asktoapiengine.engine.ai.browse.core;
 
-import com.asktoapiengine.engine.ai.browse.llm.BrowseLlmService;
 import com.asktoapiengine.engine.ai.browse.llm.BrowseWebClientLlmService;
 import com.asktoapiengine.engine.ai.browse.rag.SwaggerRetrievalService;
 import com.asktoapiengine.engine.ai.browse.swagger.ApiOperationDescriptor;
 import lombok.RequiredArgsConstructor;
 import lombok.extern.slf4j.Slf4j;
 import org.springframework.stereotype.Service;
+import reactor.core.publisher.Flux;
+import reactor.core.publisher.Mono;
+import reactor.core.scheduler.Schedulers;
 
 import java.util.List;
+import java.util.Optional;
 
 /**
  * BrowseService orchestrates the full "Browse APIs" use case.
  *
  * Responsibilities:
  *  1. Accept the user's natural language query.
- *  2. Use SwaggerRetrievalService (R in RAG) to get relevant Swagger operations.
- *  3. Use BrowseLlmService to ask the LLM to explain which endpoint(s) to use and how.
- *  4. Return a plain-English answer string to the REST controller.
+ *  2. Check BrowseSemanticCache — near-duplicate questions reuse the
+ *     previous answer and skip the LLM entirely.
+ *  3. Use SwaggerRetrievalService (R in RAG) to get relevant Swagger operations.
+ *  4. Use BrowseWebClientLlmService to ask the LLM to explain which endpoint(s) to use and how.
+ *  5. Return a plain-English answer string to the REST controller.
  *
  * This service:
  *  - Does NOT know about HTTP details (that's the controller's job).
@@ -31,12 +36,15 @@ public class BrowseService {
 
     private final SwaggerRetrievalService retrievalService;
 
-    // Existing ChatModel-based LLM service (Spring AI)
-    private final BrowseLlmService browseLlmService;
-
-    // New WebClient-based LLM service (using LlmClient + OpenAI HTTP API)
+    // WebClient-based LLM service (using LlmClient + OpenAI HTTP API).
+    // This is the single active LLM path; the ChatModel-based
+    // BrowseLlmService still exists in the llm package as a reference
+    // implementation but is no longer wired into this pipeline.
     private final BrowseWebClientLlmService browseWebClientLlmService;
 
+    // Semantic cache so repeated/paraphrased queries skip the LLM round-trip
+    private final BrowseSemanticCache semanticCache;
+
     /**
      * Main method to be called by the controller for /ai/browse.
      *
@@ -50,7 +58,22 @@ public class BrowseService {
                     + "\"How do I get index levels for NIFTY 50 between two dates?\").";
         }
 
-        // 1. Use RAG retrieval to get the most relevant Swagger operations
+        // 1. Semantic cache: if a near-identical question was answered recently,
+        //    reuse that answer and skip retrieval + LLM entirely.
+        //    A cache failure must never break the main flow, so we degrade gracefully.
+        float[] queryVector = null;
+        try {
+            queryVector = semanticCache.embedQuery(userQuery);
+            Optional<String> cached = semanticCache.findSimilar(queryVector);
+            if (cached.isPresent()) {
+                log.info("BrowseService: semantic cache hit for query='{}'", userQuery);
+                return cached.get();
+            }
+        } catch (RuntimeException ex) {
+            log.warn("BrowseService: semantic cache lookup failed, continuing without cache", ex);
+        }
+
+        // 2. Use RAG retrieval to get the most relevant Swagger operations
         List<ApiOperationDescriptor> candidateOperations =
                 retrievalService.retrieveRelevantOperations(userQuery);
 
@@ -69,18 +92,133 @@ public class BrowseService {
                     + "Please try rephrasing your query or check if the API is documented.";
         }
 
-        // 2. Ask the LLM to analyze these operations and explain the best endpoint(s) to use
-
-        // OPTION 1: Use existing Spring AI ChatModel-based implementation
-//        return browseLlmService.getBrowseAnswer(userQuery, candidateOperations);
-
-        // OPTION 2: Use new WebClient-based implementation (OpenAI HTTP API)
-        // To switch, comment the line above and uncomment the line below:
+        // 3. Ask the LLM to analyze these operations and explain the best endpoint(s) to use.
+        // (To experiment with the Spring AI ChatModel path instead, wire
+        // BrowseLlmService back in and delegate to it here.)
+        // LLM failures surface as exceptions and are mapped to a fallback
+        // message HERE, so only real answers ever reach the semantic cache —
+        // a transient OpenAI outage must not be served to every similar query
+        // for the whole cache TTL.
         log.info("BrowseService: delegating to WebClient-based LLM");
-        String answer = browseWebClientLlmService.getBrowseAnswer(userQuery, candidateOperations);
+        String answer;
+        try {
+            answer = browseWebClientLlmService.getBrowseAnswer(userQuery, candidateOperations);
+        } catch (RuntimeException ex) {
+            log.error("BrowseService: LLM call failed, returning fallback message (not cached)", ex);
+            return "Sorry, I could not process your browse request via WebClient due to an internal error: "
+                    + ex.getMessage();
+        }
 
         log.info("BrowseService: received answer of length={}", answer != null ? answer.length() : 0);
 
+        // 4. Store the fresh answer in the semantic cache for future near-duplicates
+        if (queryVector != null && answer != null) {
+            semanticCache.store(userQuery, queryVector, answer);
+        }
+
         return answer;
     }
+
+    /**
+     * Streaming variant of {@link #handleBrowseQuery} used by the controller.
+     *
+     * Same pipeline (semantic cache → RAG retrieval → LLM), but the LLM
+     * answer is emitted as token chunks while it is being generated, so the
+     * client's time-to-first-byte is milliseconds instead of the full
+     * completion latency. Cache hits and guard messages are emitted as a
+     * single chunk. Freshly streamed answers are re-assembled on the fly and
+     * stored in the semantic cache once the stream completes without error;
+     * answers cut short by a mid-stream failure are never cached.
+     *
+     * @param userQuery Natural language question about the APIs.
+     * @return stream of plain-text answer chunks
+     */
+    public Flux<String> handleBrowseQueryStream(String userQuery) {
+        log.info("Handling streaming browse query='{}'", userQuery);
+        if (userQuery == null || userQuery.isBlank()) {
+            return Flux.just("Please provide a question about the APIs (for example: "
+                    + "\"How do I get index levels for NIFTY 50 between two dates?\").");
+        }
+
+        // Cache lookup + RAG retrieval block on embedding HTTP calls and the
+        // vector scan. Run them on the boundedElastic scheduler so the request
+        // thread is released immediately instead of being held for the whole
+        // preparation phase. (SimpleVectorStore has no async search variant,
+        // so offloading the blocking call is the available equivalent.)
+        return Mono.fromCallable(() -> prepareBrowse(userQuery))
+                .subscribeOn(Schedulers.boundedElastic())
+                .flatMapMany(preparation -> {
+                    // 1. Semantic cache hit: single-chunk answer, no LLM call
+                    if (preparation.cachedAnswer() != null) {
+                        return Flux.just(preparation.cachedAnswer());
+                    }
+
+                    // 2. Nothing relevant in the catalog: graceful message
+                    if (preparation.candidateOperations().isEmpty()) {
+                        return Flux.just("I could not find any API endpoints in the documentation that match your question. "
+                                + "Please try rephrasing your query or check if the API is documented.");
+                    }
+
+                    // 3. Stream the LLM answer, re-assembling it for the semantic cache.
+                    //    Error handling deliberately sits DOWNSTREAM of the
+                    //    cache-storing doOnComplete: a mid-stream failure
+                    //    (timeout, dropped connection) arrives as an error
+                    //    signal, so doOnComplete never fires and the truncated
+                    //    answer is not cached — the client still gets the
+                    //    fallback message appended to whatever was streamed.
+                    float[] queryVector = preparation.queryVector();
+                    StringBuilder aggregated = new StringBuilder();
+
+                    return browseWebClientLlmService.streamBrowseAnswer(userQuery, preparation.candidateOperations())
+                            .doOnNext(aggregated::append)
+                            .doOnComplete(() -> {
+                                if (queryVector != null && aggregated.length() > 0) {
+                                    semanticCache.store(userQuery, queryVector, aggregated.toString());
+                                }
+                            })
+                            .onErrorResume(ex -> {
+                                log.error("BrowseService: LLM stream failed, returning fallback message (not cached)", ex);
+                                return Flux.just("Sorry, I could not process your browse request via WebClient due to an internal error: "
+                                        + ex.getMessage());
+                            });
+                });
+    }
+
+    /**
+     * Result of the blocking preparation phase (semantic cache check + RAG
+     * retrieval) that runs off the request thread.
+     *
+     * Exactly one of cachedAnswer / candidateOperations is meaningful:
+     * a non-null cachedAnswer short-circuits the LLM call entirely.
+     */
+    private record BrowsePreparation(String cachedAnswer,
+                                     float[] queryVector,
+                                     List<ApiOperationDescriptor> candidateOperations) {
+    }
+
+    /**
+     * Runs the semantic cache check and RAG retrieval (both blocking).
+     * Same graceful cache degradation as the blocking path.
+     */
+    private BrowsePreparation prepareBrowse(String userQuery) {
+        float[] queryVector = null;
+        try {
+            queryVector = semanticCache.embedQuery(userQuery);
+            Optional<String> cached = semanticCache.findSimilar(queryVector);
+            if (cached.isPresent()) {
+                log.info("BrowseService: semantic cache hit for streaming query='{}'", userQuery);
+                return new BrowsePreparation(cached.get(), queryVector, List.of());
+            }
+        } catch (RuntimeException ex) {
+            log.warn("BrowseService: semantic cache lookup failed, continuing without cache", ex);
+        }
+
+        List<ApiOperationDescriptor> candidateOperations =
+                retrievalService.retrieveRelevantOperations(userQuery);
+
+        log.info("BrowseService: retrieved {} candidate operations for streaming query='{}'",
+                candidateOperations.size(), userQuery);
+
+        return new BrowsePreparation(null, queryVector, candidateOperations);
+    }
 }
@@ -2,11 +2,11 @@ package com.asktoapiengine.engine.ai.browse.llm;
 
 import com.asktoapiengine.engine.ai.browse.swagger.ApiOperationDescriptor;
 import com.asktoapiengine.engine.ai.browse.swagger.ApiParameterDescriptor;
-import com.asktoapiengine.engine.ai.browse.swagger.ApiParameterLocation;
 import org.springframework.stereotype.Component;
 
 import java.util.List;
-import java.util.stream.Collectors;
+import java.util.Map;
+import java.util.concurrent.ConcurrentHashMap;
 
 /**
  * BrowsePromptBuilder is responsible for constructing the prompt
@@ -31,6 +31,44 @@ import java.util.stream.Collectors;
 @Component
 public class BrowsePromptBuilder {
 
+    /**
+     * System-style instructions / high-level guidance. Fixed for every
+     * request, so it is assembled once at class load instead of through a
+     * chain of small appends per prompt.
+     */
+    private static final String PROMPT_HEADER =
+            "You are an expert API assistant for a financial data platform.\n"
+            + "Your job is to help the user understand WHICH HTTP API endpoint to call,\n"
+            + "and HOW to call it (method, path, path params, query params, and request body if any).\n"
+            + "You MUST only answer using the API operations listed below.\n"
+            + "If none of the operations are a good match, say that clearly.\n\n";
+
+    /** Instruction on how to answer; also fixed for every request. */
+    private static final String ANSWER_INSTRUCTIONS =
+            "\nNow, based on the user's question and the operations above, "
+            + "explain in clear English which endpoint(s) the user should call.\n"
+            + "For each recommended endpoint, include:\n"
+            + "  - HTTP method (e.g., GET, POST)\n"
+            + "  - Full path (e.g., /indices/{indexId}/levels)\n"
+            + "  - Path parameters with example values and meaning\n"
+            + "  - Query parameters with example values and meaning\n"
+            + "  - Whether a JSON request body is required (and a rough JSON example if applicable)\n"
+            + "  - A short explanation of what the endpoint returns.\n\n"
+            + "Format your response as clear bullet points and short paragraphs. "
+            + "Do NOT invent endpoints that are not listed above.\n";
+
+    /**
+     * Cache of the formatted prompt block per operation, keyed by operation ID.
+     *
+     * ApiOperationDescriptor is immutable and the catalog is fixed after
+     * startup, so the block for a given operation never changes. Retrieval
+     * returns the same handful of operations over and over for similar
+     * queries — formatting each one once turns the per-request string work
+     * into a map lookup. (The numbering prefix varies per request, so it
+     * stays outside the cached block.)
+     */
+    private final Map<String, String> operationBlockCache = new ConcurrentHashMap<>();
+
     /**
      * Builds the full prompt string for the given user query and candidate operations.
      *
@@ -41,12 +79,8 @@ public class BrowsePromptBuilder {
     public String buildPrompt(String userQuery, List<ApiOperationDescriptor> candidateOperations) {
         StringBuilder sb = new StringBuilder();
 
-        // --- System-style instructions / high-level guidance ---
-        sb.append("You are an expert API assistant for a financial data platform.\n");
-        sb.append("Your job is to help the user understand WHICH HTTP API endpoint to call,\n");
-        sb.append("and HOW to call it (method, path, path params, query params, and request body if any).\n");
-        sb.append("You MUST only answer using the API operations listed below.\n");
-        sb.append("If none of the operations are a good match, say that clearly.\n\n");
+        // --- System-style instructions / high-level guidance (precompiled) ---
+        sb.append(PROMPT_HEADER);
 
         // --- User query section ---
         sb.append("User question:\n");
@@ -60,33 +94,31 @@ public class BrowsePromptBuilder {
         } else {
             int index = 1;
             for (ApiOperationDescriptor op : candidateOperations) {
-                appendOperationSummary(sb, index, op);
+                sb.append(index).append(") ").append(operationBlock(op));
                 index++;
             }
         }
 
-        // --- Instruction on how to answer ---
-        sb.append("\nNow, based on the user's question and the operations above, ");
-        sb.append("explain in clear English which endpoint(s) the user should call.\n");
-        sb.append("For each recommended endpoint, include:\n");
-        sb.append("  - HTTP method (e.g., GET, POST)\n");
-        sb.append("  - Full path (e.g., /indices/{indexId}/levels)\n");
-        sb.append("  - Path parameters with example values and meaning\n");
-        sb.append("  - Query parameters with example values and meaning\n");
-        sb.append("  - Whether a JSON request body is required (and a rough JSON example if applicable)\n");
-        sb.append("  - A short explanation of what the endpoint returns.\n\n");
-
-        sb.append("Format your response as clear bullet points and short paragraphs. ");
-        sb.append("Do NOT invent endpoints that are not listed above.\n");
+        // --- Instruction on how to answer (precompiled) ---
+        sb.append(ANSWER_INSTRUCTIONS);
 
         return sb.toString();
     }
 
     /**
-     * Appends a concise summary of one ApiOperationDescriptor to the prompt.
+     * Returns the formatted prompt block for one operation, computing it on
+     * first use and serving the memoized copy afterwards.
      */
-    private void appendOperationSummary(StringBuilder sb, int index, ApiOperationDescriptor op) {
-        sb.append(index).append(") ");
+    private String operationBlock(ApiOperationDescriptor op) {
+        return operationBlockCache.computeIfAbsent(nullSafe(op.getId()), id -> buildOperationBlock(op));
+    }
+
+    /**
+     * Builds a concise summary of one ApiOperationDescriptor for the prompt
+     * (everything after the numbering prefix).
+     */
+    private String buildOperationBlock(ApiOperationDescriptor op) {
+        StringBuilder sb = new StringBuilder();
         sb.append("ID: ").append(nullSafe(op.getId())).append("\n");
         sb.append("   Method: ").append(nullSafeUpper(op.getHttpMethod())).append("\n");
         sb.append("   Path: ").append(nullSafe(op.getPath())).append("\n");
@@ -103,14 +135,10 @@ public class BrowsePromptBuilder {
             sb.append("   Tags: ").append(String.join(", ", op.getTags())).append("\n");
         }
 
-        // Separate parameters by location (path vs query) to make it easier for the model.
-        List<ApiParameterDescriptor> pathParams = op.getParameters().stream()
-                .filter(p -> p.getLocation() == ApiParameterLocation.PATH)
-                .collect(Collectors.toList());
-
-        List<ApiParameterDescriptor> queryParams = op.getParameters().stream()
-                .filter(p -> p.getLocation() == ApiParameterLocation.QUERY)
-                .collect(Collectors.toList());
+        // Parameters are already partitioned by location at load time
+        // (see ApiOperationDescriptor.pathParameters / queryParameters).
+        List<ApiParameterDescriptor> pathParams = op.getPathParameters();
+        List<ApiParameterDescriptor> queryParams = op.getQueryParameters();
 
         if (!pathParams.isEmpty()) {
             sb.append("   Path parameters:\n");
@@ -141,12 +169,20 @@ public class BrowsePromptBuilder {
         }
 
         sb.append("\n");
+
+        return sb.toString();
     }
 
     /**
      * Short helper to render a single parameter line within the prompt.
      */
     private void appendParameterSummary(StringBuilder sb, ApiParameterDescriptor p) {
+        // Read each field once into a local instead of repeating accessor
+        // calls across the conditionals below
+        String type = p.getType();
+        String description = p.getDescription();
+        String example = p.getExample();
+
         sb.append("      - ").append(p.getName());
 
         if (p.isRequired()) {
@@ -155,16 +191,16 @@ public class BrowsePromptBuilder {
             sb.append(" [optional]");
         }
 
-        if (p.getType() != null) {
-            sb.append(" (type: ").append(p.getType()).append(")");
+        if (type != null) {
+            sb.append(" (type: ").append(type).append(")");
         }
 
-        if (p.getDescription() != null && !p.getDescription().isBlank()) {
-            sb.append(" - ").append(p.getDescription());
+        if (description != null && !description.isBlank()) {
+            sb.append(" - ").append(description);
         }
 
-        if (p.getExample() != null && !p.getExample().isBlank()) {
-            sb.append(" (example: ").append(p.getExample()).append(")");
+        if (example != null && !example.isBlank()) {
+            sb.append(" (example: ").append(example).append(")");
         }
 
         sb.append("\n");
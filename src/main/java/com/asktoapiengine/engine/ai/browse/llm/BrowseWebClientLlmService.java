@@ -4,6 +4,7 @@ import com.asktoapiengine.engine.ai.browse.swagger.ApiOperationDescriptor;
 import lombok.RequiredArgsConstructor;
 import lombok.extern.slf4j.Slf4j;
 import org.springframework.stereotype.Service;
+import reactor.core.publisher.Flux;
 
 import java.util.List;
 
@@ -35,6 +36,11 @@ public class BrowseWebClientLlmService {
     /**
      * Main entry point for the Browse use case on the LLM side (WebClient path).
      *
+     * LLM failures propagate as RuntimeExceptions instead of being mapped to
+     * an apology string here — the caller (BrowseService) decides on the
+     * fallback message and, crucially, skips the semantic cache on errors so
+     * a transient outage never gets cached as an answer.
+     *
      * @param userQuery           natural language question from the user
      * @param candidateOperations list of relevant API operations (from RAG retrieval)
      * @return plain-English answer describing which endpoint(s) to use and how
@@ -56,16 +62,38 @@ public class BrowseWebClientLlmService {
         }
 
         // Delegate to the LLM via LlmClient (backed by WebClient + OpenAI HTTP API).
-        try {
-            log.info("BrowseWebClientLlmService: calling LlmClient.generate(...)");
-            String answer = llmClient.generate(prompt);
-            log.info("BrowseWebClientLlmService: LLM returned answer length={}",
-                    answer != null ? answer.length() : 0);
-            return answer;
-        } catch (RuntimeException ex) {
-            log.error("BrowseWebClientLlmService: error while calling LLM", ex);
-            return "Sorry, I could not process your browse request via WebClient due to an internal error: "
-                    + ex.getMessage();
+        log.info("BrowseWebClientLlmService: calling LlmClient.generate(...)");
+        String answer = llmClient.generate(prompt);
+        log.info("BrowseWebClientLlmService: LLM returned answer length={}",
+                answer != null ? answer.length() : 0);
+        return answer;
+    }
+
+    /**
+     * Streaming variant of {@link #getBrowseAnswer}: emits the answer as token
+     * chunks while the LLM is still generating, so the client sees output
+     * almost immediately instead of waiting for the full completion.
+     *
+     * Mid-stream failures (timeouts, dropped connections) propagate as error
+     * signals instead of being mapped to an apology chunk here — converting
+     * them to a normal completion would make the caller's doOnComplete fire
+     * and cache the truncated answer. BrowseService applies the fallback
+     * message downstream of its cache-storing step.
+     *
+     * @param userQuery           natural language question from the user
+     * @param candidateOperations list of relevant API operations (from RAG retrieval)
+     * @return stream of plain-text answer chunks
+     */
+    public Flux<String> streamBrowseAnswer(String userQuery, List<ApiOperationDescriptor> candidateOperations) {
+        log.info("BrowseWebClientLlmService: building prompt (streaming) for query='{}' with {} candidate operations",
+                userQuery, candidateOperations.size());
+
+        if (userQuery == null || userQuery.isBlank()) {
+            return Flux.just("I did not receive a question. Please provide a natural language query about the APIs.");
         }
+
+        String prompt = promptBuilder.buildPrompt(userQuery, candidateOperations);
+
+        return llmClient.generateStream(prompt);
     }
 }
@@ -1,10 +1,13 @@
 package com.asktoapiengine.engine.ai.browse.llm;
 
+import reactor.core.publisher.Flux;
+
 /**
  * Simple abstraction over any Large Language Model (LLM).
  *
- * For now, it just exposes a single "generate" method which takes a
- * plain text prompt and returns a plain text response.
+ * It exposes a blocking "generate" method which takes a plain text prompt
+ * and returns a plain text response, plus a streaming variant that emits
+ * the response token-by-token as the model produces it.
  *
  * This allows us to swap OpenAI (ChatGPT), SparkAssist, or any other
  * provider without changing the higher-level services.
@@ -14,8 +17,25 @@ public interface LlmClient {
     /**
      * Generate a textual response for the given prompt.
      *
+     * Failures (HTTP errors, malformed provider responses) surface as
+     * RuntimeExceptions rather than apology strings, so callers can tell
+     * a real answer from an error and react accordingly (fallback message,
+     * skip caching, ...).
+     *
      * @param prompt the full prompt text (already formatted)
      * @return the LLM's textual response
      */
     String generate(String prompt);
+
+    /**
+     * Generate a textual response for the given prompt, streamed as token
+     * chunks while the model is still producing them.
+     *
+     * Concatenating all emitted chunks yields the same text generate()
+     * would have returned; the win is time-to-first-byte, not total time.
+     *
+     * @param prompt the full prompt text (already formatted)
+     * @return a stream of response text chunks
+     */
+    Flux<String> generateStream(String prompt);
 }
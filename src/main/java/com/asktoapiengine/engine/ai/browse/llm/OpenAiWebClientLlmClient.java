@@ -1,14 +1,20 @@
 package com.asktoapiengine.engine.ai.browse.llm;
 
-import com.fasterxml.jackson.databind.JsonNode;
+import com.asktoapiengine.engine.ai.browse.config.AiBrowseProperties;
+import com.fasterxml.jackson.annotation.JsonIgnoreProperties;
+import com.fasterxml.jackson.annotation.JsonInclude;
+import com.fasterxml.jackson.core.JsonProcessingException;
+import com.fasterxml.jackson.databind.ObjectMapper;
 import lombok.RequiredArgsConstructor;
 import lombok.extern.slf4j.Slf4j;
 import org.springframework.beans.factory.annotation.Value;
+import org.springframework.http.MediaType;
 import org.springframework.stereotype.Service;
 import org.springframework.web.reactive.function.client.WebClient;
+import reactor.core.publisher.Flux;
 
+import java.time.Duration;
 import java.util.List;
-import java.util.Map;
 
 /**
  * WebClient-based implementation of LlmClient that calls OpenAI's
@@ -17,6 +23,12 @@ import java.util.Map;
  * This is written in a blocking style (using block()) so that it can
  * be easily integrated into the existing imperative Spring MVC codebase.
  *
+ * The wire format is modeled as small records instead of Map payloads and
+ * JsonNode trees: Jackson binds records with generated (non-reflective
+ * per-field lookup) accessors, the response skips building a full JSON tree
+ * just to pluck one string out of it, and the compiler checks the field
+ * names for us.
+ *
  * Later, when you switch to SparkAssist, you can add another implementation
  * of LlmClient that calls the SparkAssist endpoint instead.
  */
@@ -27,69 +39,152 @@ public class OpenAiWebClientLlmClient implements LlmClient {
 
     private final WebClient openAiWebClient;
 
+    /** Used to parse the JSON payload of each streamed SSE chunk. */
+    private final ObjectMapper objectMapper;
+
+    /**
+     * Shared feature configuration; this client uses the streaming timeout
+     * from the asktoapi.browse.llm.* group.
+     */
+    private final AiBrowseProperties properties;
+
     /**
      * Model name is externalized so we can change it via configuration.
      * Example value: gpt-4o-mini
+     * (Kept as @Value because it belongs to the spring.ai.* namespace,
+     * not our asktoapi.browse.* feature config.)
      */
     @Value("${spring.ai.openai.chat.options.model:gpt-4o-mini}")
     private String modelName;
 
+    // --- OpenAI /chat/completions wire format -------------------------------
+
+    /** One chat message; used in both request and response payloads. */
+    @JsonIgnoreProperties(ignoreUnknown = true)
+    record ChatMessage(String role, String content) {
+    }
+
+    /** Request body; "stream" is omitted entirely for blocking calls. */
+    @JsonInclude(JsonInclude.Include.NON_NULL)
+    record ChatCompletionRequest(String model, Boolean stream, List<ChatMessage> messages) {
+    }
+
+    @JsonIgnoreProperties(ignoreUnknown = true)
+    record Choice(ChatMessage message) {
+    }
+
+    @JsonIgnoreProperties(ignoreUnknown = true)
+    record ChatCompletionResponse(List<Choice> choices) {
+    }
+
+    /** Incremental content of one streamed chunk. */
+    @JsonIgnoreProperties(ignoreUnknown = true)
+    record Delta(String content) {
+    }
+
+    @JsonIgnoreProperties(ignoreUnknown = true)
+    record StreamChoice(Delta delta) {
+    }
+
+    @JsonIgnoreProperties(ignoreUnknown = true)
+    record StreamChunk(List<StreamChoice> choices) {
+    }
+
+    // ------------------------------------------------------------------------
+
     @Override
     public String generate(String prompt) {
         log.info("OpenAiWebClientLlmClient: sending request to OpenAI model='{}'", modelName);
         if (log.isDebugEnabled()) {
             log.debug("OpenAiWebClientLlmClient: prompt length={}", prompt != null ? prompt.length() : 0);
         }
-        // Build request body using Map so it is easy to extend later.
-        Map<String, Object> requestBody = Map.of(
-                "model", modelName,
-                "messages", List.of(
-                        Map.of(
-                                "role", "user",
-                                "content", prompt
-                        )
-                )
+
+        ChatCompletionRequest requestBody = new ChatCompletionRequest(
+                modelName,
+                null,
+                List.of(new ChatMessage("user", prompt))
         );
 
-        JsonNode response = openAiWebClient
+        ChatCompletionResponse response = openAiWebClient
                 .post()
                 .uri("/chat/completions")
                 .bodyValue(requestBody)
                 .retrieve()
-                .bodyToMono(JsonNode.class)
+                .bodyToMono(ChatCompletionResponse.class)
                 .block(); // ok here, since we are in a non-reactive stack
         log.info("OpenAiWebClientLlmClient: received response from OpenAI");
 
-        if (log.isDebugEnabled()) {
-            log.debug("OpenAiWebClientLlmClient: raw response = {}", response);
-        }
-
-        // Safely navigate the response JSON:
-        // choices[0].message.content
+        // Safely navigate the response: choices[0].message.content.
+        // A malformed response is an error, not an answer — throwing (instead
+        // of returning an apology string) lets callers tell the two apart,
+        // e.g. so failure text never ends up in the semantic cache.
         if (response == null) {
-            return "Sorry, I could not process your request (empty response from model).";
+            throw new IllegalStateException("Empty response from model");
         }
 
-        JsonNode choicesNode = response.get("choices");
-        if (choicesNode == null || !choicesNode.isArray() || choicesNode.isEmpty()) {
-            return "Sorry, I could not process your request (no choices returned by model).";
+        List<Choice> choices = response.choices();
+        if (choices == null || choices.isEmpty()) {
+            throw new IllegalStateException("No choices returned by model");
         }
 
-        JsonNode firstChoice = choicesNode.get(0);
+        Choice firstChoice = choices.get(0);
         if (firstChoice == null) {
-            return "Sorry, I could not process your request (invalid choice structure).";
+            throw new IllegalStateException("Invalid choice structure in model response");
         }
 
-        JsonNode messageNode = firstChoice.get("message");
-        if (messageNode == null) {
-            return "Sorry, I could not process your request (missing message field).";
+        if (firstChoice.message() == null) {
+            throw new IllegalStateException("Missing message field in model response");
         }
 
-        JsonNode contentNode = messageNode.get("content");
-        if (contentNode == null || contentNode.isNull()) {
-            return "Sorry, I could not process your request (missing content field).";
+        String content = firstChoice.message().content();
+        if (content == null) {
+            throw new IllegalStateException("Missing content field in model response");
         }
 
-        return contentNode.asText();
+        return content;
+    }
+
+    @Override
+    public Flux<String> generateStream(String prompt) {
+        log.info("OpenAiWebClientLlmClient: streaming request to OpenAI model='{}'", modelName);
+
+        ChatCompletionRequest requestBody = new ChatCompletionRequest(
+                modelName,
+                Boolean.TRUE,
+                List.of(new ChatMessage("user", prompt))
+        );
+
+        // OpenAI streams Server-Sent Events; each event's data field is a JSON
+        // chunk with choices[0].delta.content, terminated by a literal [DONE].
+        return openAiWebClient
+                .post()
+                .uri("/chat/completions")
+                .accept(MediaType.TEXT_EVENT_STREAM)
+                .bodyValue(requestBody)
+                .retrieve()
+                .bodyToFlux(String.class)
+                .timeout(Duration.ofSeconds(properties.getLlm().getStreamTimeoutSeconds()))
+                .takeWhile(data -> !"[DONE]".equals(data))
+                .map(this::extractDeltaContent)
+                .filter(chunk -> !chunk.isEmpty());
+    }
+
+    /**
+     * Extracts choices[0].delta.content from one streamed chunk.
+     * Chunks without content (role preludes, finish markers) map to "".
+     */
+    private String extractDeltaContent(String chunkJson) {
+        try {
+            StreamChunk chunk = objectMapper.readValue(chunkJson, StreamChunk.class);
+            if (chunk.choices() == null || chunk.choices().isEmpty()) {
+                return "";
+            }
+
+            Delta delta = chunk.choices().get(0).delta();
+            return (delta != null && delta.content() != null) ? delta.content() : "";
+        } catch (JsonProcessingException e) {
+            log.warn("OpenAiWebClientLlmClient: could not parse streamed chunk, skipping", e);
+            return "";
+        }
     }
 }
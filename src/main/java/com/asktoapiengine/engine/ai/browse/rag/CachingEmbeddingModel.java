@@ -0,0 +1,87 @@
+package com.asktoapiengine.engine.ai.browse.rag;
+
+import lombok.extern.slf4j.Slf4j;
+import org.springframework.ai.document.Document;
+import org.springframework.ai.embedding.EmbeddingModel;
+import org.springframework.ai.embedding.EmbeddingRequest;
+import org.springframework.ai.embedding.EmbeddingResponse;
+
+import java.util.LinkedHashMap;
+import java.util.Map;
+
+/**
+ * EmbeddingModel decorator with an exact-match LRU cache for single-text
+ * embeddings.
+ *
+ * Many clients send literally identical queries (API-test replays, polling
+ * clients, users re-running the same question). Each of those paid a
+ * ~100ms embedding round-trip to OpenAI before the vector search could
+ * even start. Embeddings are deterministic for a given model + text, so an
+ * exact-match cache in front of the delegate removes that round-trip and
+ * leaves only the cheap in-memory similarity search.
+ *
+ * Scope:
+ *  - Only {@link #embed(String)} is cached — that is the path both the
+ *    vector store (query embedding) and BrowseSemanticCache use.
+ *  - Document embeddings pass through; they are embedded once at startup
+ *    via PrefetchingEmbeddingModel anyway.
+ *
+ * This composes with BrowseSemanticCache: the LRU here catches identical
+ * strings, the semantic cache catches paraphrases. On a semantic-cache
+ * miss the query embedding computed here is reused by the vector search
+ * for free (same string, cache hit).
+ */
+@Slf4j
+public class CachingEmbeddingModel implements EmbeddingModel {
+
+    private final EmbeddingModel delegate;
+    private final int maxSize;
+
+    /** Access-ordered LRU map of text → embedding vector. */
+    private final Map<String, float[]> cache;
+
+    public CachingEmbeddingModel(EmbeddingModel delegate, int maxSize) {
+        this.delegate = delegate;
+        this.maxSize = maxSize;
+        this.cache = new LinkedHashMap<>(16, 0.75f, true) {
+            @Override
+            protected boolean removeEldestEntry(Map.Entry<String, float[]> eldest) {
+                return size() > CachingEmbeddingModel.this.maxSize;
+            }
+        };
+    }
+
+    @Override
+    public float[] embed(String text) {
+        synchronized (cache) {
+            float[] hit = cache.get(text);
+            if (hit != null) {
+                log.debug("CachingEmbeddingModel: embedding cache hit");
+                // Defensive copy — callers may normalize vectors in place
+                return hit.clone();
+            }
+        }
+
+        float[] vector = delegate.embed(text);
+
+        synchronized (cache) {
+            cache.put(text, vector.clone());
+        }
+        return vector;
+    }
+
+    @Override
+    public EmbeddingResponse call(EmbeddingRequest request) {
+        return delegate.call(request);
+    }
+
+    @Override
+    public float[] embed(Document document) {
+        return delegate.embed(document);
+    }
+
+    @Override
+    public int dimensions() {
+        return delegate.dimensions();
+    }
+}
@@ -0,0 +1,118 @@
+package com.asktoapiengine.engine.ai.browse.rag;
+
+import lombok.RequiredArgsConstructor;
+import lombok.extern.slf4j.Slf4j;
+import org.springframework.ai.document.Document;
+import org.springframework.ai.document.MetadataMode;
+import org.springframework.ai.embedding.EmbeddingModel;
+import org.springframework.ai.embedding.EmbeddingRequest;
+import org.springframework.ai.embedding.EmbeddingResponse;
+
+import java.util.ArrayList;
+import java.util.List;
+import java.util.Map;
+import java.util.concurrent.CompletableFuture;
+import java.util.concurrent.ConcurrentHashMap;
+
+/**
+ * EmbeddingModel decorator that lets startup indexing batch all document
+ * embeddings into as few OpenAI calls as possible.
+ *
+ * Why this exists:
+ *  - SimpleVectorStore.add(documents) embeds each Document one by one,
+ *    which means one HTTPS round-trip to OpenAI PER swagger operation.
+ *  - The OpenAI embeddings endpoint accepts up to 2048 inputs per request,
+ *    so the whole catalog fits comfortably into a single call.
+ *
+ * How it works:
+ *  1. SwaggerDocumentIndexer calls {@link #prefetch(List)} BEFORE handing
+ *     the documents to the vector store. That performs one batched
+ *     embedding call and parks the vectors keyed by document ID.
+ *  2. When SimpleVectorStore then asks this model to embed each Document,
+ *     {@link #embed(Document)} serves the prefetched vector instead of
+ *     going back over the network.
+ *
+ * Anything that is not prefetched (e.g., user queries at search time)
+ * passes straight through to the delegate, so this decorator is safe to
+ * use as the application-wide EmbeddingModel.
+ */
+@Slf4j
+@RequiredArgsConstructor
+public class PrefetchingEmbeddingModel implements EmbeddingModel {
+
+    /** OpenAI caps the embeddings endpoint at 2048 inputs per request. */
+    private static final int MAX_BATCH_SIZE = 2048;
+
+    private final EmbeddingModel delegate;
+
+    /** Vectors computed by {@link #prefetch(List)}, keyed by document ID. */
+    private final Map<String, float[]> prefetchedByDocId = new ConcurrentHashMap<>();
+
+    /**
+     * Embeds all given documents in batched calls (one HTTP request per
+     * 2048 documents) and parks the vectors for the subsequent per-document
+     * embed() calls made by the vector store.
+     *
+     * Uses the same formatted content (MetadataMode.EMBED) the delegate
+     * would embed, so the resulting vectors are identical to the
+     * one-by-one path.
+     */
+    public void prefetch(List<Document> documents) {
+        if (documents == null || documents.isEmpty()) {
+            return;
+        }
+
+        // Split into batches at the API input cap
+        List<List<Document>> batches = new ArrayList<>();
+        for (int from = 0; from < documents.size(); from += MAX_BATCH_SIZE) {
+            batches.add(documents.subList(from, Math.min(from + MAX_BATCH_SIZE, documents.size())));
+        }
+
+        if (batches.size() == 1) {
+            embedBatch(batches.get(0));
+        } else {
+            // Batches are independent HTTP requests, so overlap their network
+            // latency instead of waiting on them one after another.
+            CompletableFuture<?>[] futures = batches.stream()
+                    .map(batch -> CompletableFuture.runAsync(() -> embedBatch(batch)))
+                    .toArray(CompletableFuture[]::new);
+            CompletableFuture.allOf(futures).join();
+        }
+
+        log.info("PrefetchingEmbeddingModel: prefetched {} document embeddings in {} batched call(s)",
+                documents.size(), batches.size());
+    }
+
+    /** Embeds one batch with a single OpenAI call and parks the vectors. */
+    private void embedBatch(List<Document> batch) {
+        List<String> texts = batch.stream()
+                .map(doc -> doc.getFormattedContent(MetadataMode.EMBED))
+                .toList();
+
+        List<float[]> vectors = delegate.embed(texts);
+
+        for (int i = 0; i < batch.size(); i++) {
+            prefetchedByDocId.put(batch.get(i).getId(), vectors.get(i));
+        }
+    }
+
+    @Override
+    public EmbeddingResponse call(EmbeddingRequest request) {
+        return delegate.call(request);
+    }
+
+    @Override
+    public float[] embed(Document document) {
+        // Serve (and release) the prefetched vector if we have one
+        float[] vector = prefetchedByDocId.remove(document.getId());
+        if (vector != null) {
+            return vector;
+        }
+        return delegate.embed(document);
+    }
+
+    @Override
+    public int dimensions() {
+        return delegate.dimensions();
+    }
+}
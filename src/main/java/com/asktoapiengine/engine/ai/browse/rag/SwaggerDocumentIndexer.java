@@ -3,13 +3,16 @@ package com.asktoapiengine.engine.ai.browse.rag;
 import com.asktoapiengine.engine.ai.browse.swagger.ApiOperationDescriptor;
 import com.asktoapiengine.engine.ai.browse.swagger.SwaggerApiCatalog;
 import com.asktoapiengine.engine.ai.browse.swagger.SwaggerToDocumentMapper;
-import jakarta.annotation.PostConstruct;
 import lombok.RequiredArgsConstructor;
 import org.springframework.ai.document.Document;
 import org.springframework.ai.vectorstore.VectorStore;
+import org.springframework.boot.context.event.ApplicationReadyEvent;
+import org.springframework.context.event.EventListener;
 import org.springframework.stereotype.Component;
 
 import java.util.List;
+import java.util.concurrent.CompletableFuture;
+import java.util.concurrent.CountDownLatch;
 
 /**
  * SwaggerDocumentIndexer is responsible for:
@@ -25,6 +28,11 @@ import java.util.List;
  *
  * NOTE:
  *  - This class runs ONCE during startup.
+ *  - Indexing runs in the BACKGROUND after the app is ready, so the HTTP
+ *    port starts serving immediately instead of blocking on embedding
+ *    round-trips to OpenAI. Browse queries that arrive before indexing
+ *    finishes block on {@link #awaitIndexReady()} rather than getting a
+ *    wrong "no endpoints match" answer from an empty store.
  *  - If Swagger files change, we need to restart (POC only).
  */
 @Component
@@ -34,11 +42,50 @@ public class SwaggerDocumentIndexer {
     private final SwaggerApiCatalog catalog;
     private final SwaggerToDocumentMapper mapper;
     private final VectorStore vectorStore;
+    private final PrefetchingEmbeddingModel embeddingModel;
 
     /**
-     * Execute indexing right after Spring initializes all beans.
+     * Released once indexing has finished (successfully or not). Query paths
+     * wait on this so no request is ever answered from an empty store.
+     */
+    private final CountDownLatch indexReady = new CountDownLatch(1);
+
+    /**
+     * Kick off indexing in the background once the application is ready.
+     *
+     * Previously this ran in a @PostConstruct, so startup blocked on every
+     * embedding HTTP round-trip before the service could accept traffic.
+     */
+    @EventListener(ApplicationReadyEvent.class)
+    public void buildIndexInBackground() {
+        CompletableFuture.runAsync(this::buildIndex)
+                .whenComplete((ignored, ex) -> {
+                    if (ex != null) {
+                        System.err.println("[SwaggerDocumentIndexer] Background indexing failed: " + ex.getMessage());
+                    }
+                    // Release waiters either way — on failure, queries proceed
+                    // against whatever made it into the store instead of
+                    // hanging forever.
+                    indexReady.countDown();
+                });
+    }
+
+    /**
+     * Block until background indexing has completed. Early browse requests
+     * wait here (they just take a little longer) instead of receiving a
+     * confident wrong answer from a not-yet-populated store.
+     */
+    public void awaitIndexReady() {
+        try {
+            indexReady.await();
+        } catch (InterruptedException e) {
+            Thread.currentThread().interrupt();
+        }
+    }
+
+    /**
+     * Execute the actual indexing work.
      */
-    @PostConstruct
     public void buildIndex() {
         System.out.println("[SwaggerDocumentIndexer] Starting vector store indexing…");
 
@@ -53,7 +100,12 @@ public class SwaggerDocumentIndexer {
         // 2. Convert operations → Documents
         List<Document> documents = mapper.toDocuments(operations);
 
-        // 3. Insert all documents into the vector store
+        // 3. Embed all documents in one batched OpenAI call up front —
+        //    SimpleVectorStore otherwise performs one HTTP round-trip per document.
+        embeddingModel.prefetch(documents);
+
+        // 4. Insert all documents into the vector store (embeddings are served
+        //    from the prefetched batch, so no further network calls happen here)
         vectorStore.add(documents);
 
         System.out.println("[SwaggerDocumentIndexer] Indexed " + documents.size() + " Swagger API operations into VectorStore.");
@@ -35,6 +35,7 @@ public class SwaggerRetrievalService {
 
     private final VectorStore vectorStore;
     private final SwaggerApiCatalog catalog;
+    private final SwaggerDocumentIndexer indexer;
 
     /** Number of relevant Swagger operations to retrieve */
     private static final int DEFAULT_TOP_K = 5;
@@ -51,6 +52,10 @@ public class SwaggerRetrievalService {
             return List.of();
         }
 
+        // Startup indexing runs in the background; wait for it so early
+        // queries never search a half-populated store.
+        indexer.awaitIndexReady();
+
         // 1. Perform vector search
         SearchRequest searchRequest = SearchRequest.builder()
                 .query(query)
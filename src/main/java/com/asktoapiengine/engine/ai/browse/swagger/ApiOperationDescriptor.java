@@ -1,10 +1,8 @@
 package com.asktoapiengine.engine.ai.browse.swagger;
 
-import lombok.AllArgsConstructor;
-import lombok.Data;
-import lombok.NoArgsConstructor;
+import lombok.Builder;
+import lombok.Value;
 
-import java.util.ArrayList;
 import java.util.List;
 
 /**
@@ -16,43 +14,61 @@ import java.util.List;
  * - RAG indexing uses
  * - LLM uses to generate English explanations
  *
+ * Descriptors are built exactly once at startup and then only read
+ * (catalog lookups, prompt building, indexing), so they are immutable:
+ *
  * Lombok annotations:
- * - @Data: all getters/setters/toString/equals/hashCode
- * - @NoArgsConstructor: default constructor
- * - @AllArgsConstructor: full constructor
+ * - @Value:   all fields private final, getters, toString/equals/hashCode
+ * - @Builder: fluent construction in SwaggerLoader (no setters needed)
+ *
+ * Immutability keeps the catalog safe for concurrent reads without
+ * defensive copies and makes descriptors safely shareable/hashable.
  */
-@Data
-@NoArgsConstructor
-@AllArgsConstructor
+@Value
+@Builder
 public class ApiOperationDescriptor {
 
     /** Unique ID (preferably OpenAPI operationId; otherwise synthesized) */
-    private String id;
+    String id;
 
     /** HTTP method in upper-case (GET, POST, PUT…) */
-    private String httpMethod;
+    String httpMethod;
 
     /** Path template (e.g., "/indices/{indexId}/levels") */
-    private String path;
+    String path;
 
     /** Short summary from Swagger */
-    private String summary;
+    String summary;
 
     /** Longer description from Swagger (if available) */
-    private String description;
+    String description;
 
     /** Tags used for grouping API operations */
-    private List<String> tags = new ArrayList<>();
+    @Builder.Default
+    List<String> tags = List.of();
 
     /** List of parameters (path/query/header/cookie) */
-    private List<ApiParameterDescriptor> parameters = new ArrayList<>();
+    @Builder.Default
+    List<ApiParameterDescriptor> parameters = List.of();
+
+    /**
+     * Parameters with location PATH, precomputed at load time.
+     * Denormalized projection of {@link #parameters} so per-request
+     * consumers (prompt building) never re-partition the list.
+     */
+    @Builder.Default
+    List<ApiParameterDescriptor> pathParameters = List.of();
+
+    /** Parameters with location QUERY, precomputed at load time. */
+    @Builder.Default
+    List<ApiParameterDescriptor> queryParameters = List.of();
 
     /** Whether the operation expects a request body */
-    private boolean hasRequestBody;
+    boolean hasRequestBody;
 
     /** Optional short summary of the request body schema */
-    private String requestBodySummary;
+    String requestBodySummary;
 
     /** Name of the Swagger/YAML file this operation came from */
-    private String sourceName;
+    String sourceName;
 }
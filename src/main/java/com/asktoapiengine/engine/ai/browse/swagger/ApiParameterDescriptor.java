@@ -1,37 +1,35 @@
 package com.asktoapiengine.engine.ai.browse.swagger;
 
-import lombok.AllArgsConstructor;
-import lombok.Data;
-import lombok.NoArgsConstructor;
+import lombok.Value;
 
 /**
  * Describes a single parameter of an API operation.
  *
+ * Built once per parameter during Swagger loading and read-only afterwards,
+ * so it is an immutable value object.
+ *
  * Lombok annotations used:
- * - @Data:        Generates getters, setters, toString, equals/hashCode
- * - @NoArgsConstructor: Default constructor
- * - @AllArgsConstructor: All-args constructor
+ * - @Value: private final fields, getters, all-args constructor,
+ *           toString, equals/hashCode
  */
-@Data
-@NoArgsConstructor
-@AllArgsConstructor
+@Value
 public class ApiParameterDescriptor {
 
     /** Parameter name (e.g., "indexId", "fromDate") */
-    private String name;
+    String name;
 
     /** Where this parameter appears in the API path/query/header/cookie */
-    private ApiParameterLocation location;
+    ApiParameterLocation location;
 
     /** Whether this parameter is mandatory */
-    private boolean required;
+    boolean required;
 
     /** Simplified data type from OpenAPI schema (string, integer, date, etc.) */
-    private String type;
+    String type;
 
     /** Human-readable description from Swagger */
-    private String description;
+    String description;
 
     /** Example value from Swagger (used for creating curl examples) */
-    private String example;
+    String example;
 }
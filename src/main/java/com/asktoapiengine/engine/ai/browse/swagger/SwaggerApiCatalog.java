@@ -32,6 +32,13 @@ public class SwaggerApiCatalog {
      */
     private final Map<String, ApiOperationDescriptor> operationsById = new ConcurrentHashMap<>();
 
+    /**
+     * Inverted index: tag -> operations carrying that tag.
+     * Built once at startup so findByTag is a single map lookup instead of
+     * a linear scan over every operation on every call.
+     */
+    private final Map<String, List<ApiOperationDescriptor>> operationsByTag = new ConcurrentHashMap<>();
+
     /**
      * Immutable snapshot list of all operations.
      * Exposed via getter for read-only iteration.
@@ -63,8 +70,14 @@ public class SwaggerApiCatalog {
         // Create an immutable snapshot list for external iteration
         this.allOperations = Collections.unmodifiableList(new ArrayList<>(loaded));
 
-        // Build the ID lookup map
+        // Build the ID lookup map and the inverted tag index in one pass
         for (ApiOperationDescriptor op : loaded) {
+            if (op.getTags() != null) {
+                for (String tag : op.getTags()) {
+                    operationsByTag.computeIfAbsent(tag, t -> new ArrayList<>()).add(op);
+                }
+            }
+
             if (op.getId() == null || op.getId().isBlank()) {
                 // If somehow an operation has no ID, skip putting it into the map
                 continue;
@@ -72,6 +85,9 @@ public class SwaggerApiCatalog {
             operationsById.put(op.getId(), op);
         }
 
+        // Freeze the tag buckets — the catalog is read-only after init
+        operationsByTag.replaceAll((tag, ops) -> Collections.unmodifiableList(ops));
+
         System.out.println("[SwaggerApiCatalog] Loaded " + allOperations.size() + " operations from Swagger.");
     }
 
@@ -93,19 +109,15 @@ public class SwaggerApiCatalog {
     /**
      * Convenience method to search operations by a tag (case-sensitive by default).
      * This is optional but might help for debugging or future features.
+     *
+     * Served from the inverted tag index built at startup (O(1) lookup).
+     * The returned list is read-only.
      */
     public List<ApiOperationDescriptor> findByTag(String tag) {
         if (tag == null || tag.isBlank()) {
             return List.of();
         }
-
-        List<ApiOperationDescriptor> result = new ArrayList<>();
-        for (ApiOperationDescriptor op : allOperations) {
-            if (op.getTags() != null && op.getTags().contains(tag)) {
-                result.add(op);
-            }
-        }
-        return result;
+        return operationsByTag.getOrDefault(tag, List.of());
     }
 
     /**
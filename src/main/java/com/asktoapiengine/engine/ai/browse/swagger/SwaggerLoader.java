@@ -16,8 +16,11 @@ import java.io.IOException;
 import java.io.InputStream;
 import java.nio.charset.StandardCharsets;
 import java.util.ArrayList;
+import java.util.Arrays;
 import java.util.List;
 import java.util.Map;
+import java.util.Set;
+import java.util.stream.Collectors;
 
 /**
  * SwaggerLoader is responsible for:
@@ -45,8 +48,37 @@ public class SwaggerLoader {
      */
     private static final String SWAGGER_LOCATION_PATTERN = "classpath:/swagger/*.json";
 
+    /**
+     * HTTP methods we create descriptors for. HEAD/OPTIONS/TRACE entries in a
+     * spec are intentionally skipped — they add noise to retrieval without
+     * being useful browse answers.
+     */
+    private static final Set<PathItem.HttpMethod> SUPPORTED_METHODS = Set.of(
+            PathItem.HttpMethod.GET,
+            PathItem.HttpMethod.POST,
+            PathItem.HttpMethod.PUT,
+            PathItem.HttpMethod.DELETE,
+            PathItem.HttpMethod.PATCH);
+
     private final PathMatchingResourcePatternResolver resourceResolver = new PathMatchingResourcePatternResolver();
 
+    /**
+     * The parser and its options are stateless across files, so we build them
+     * once and reuse them for every spec instead of re-creating them per file.
+     * The specs come from our own classpath (trusted input), so the parse
+     * result does not need any re-validation on top of what swagger-parser
+     * already does while reading.
+     */
+    private final OpenAPIV3Parser openApiParser = new OpenAPIV3Parser();
+    private final ParseOptions parseOptions = buildParseOptions();
+
+    private static ParseOptions buildParseOptions() {
+        ParseOptions options = new ParseOptions();
+        options.setResolve(true);          // Resolve $refs if any
+        options.setResolveFully(true);     // Resolve fully where possible
+        return options;
+    }
+
     /**
      * Loads all Swagger files matching SWAGGER_LOCATION_PATTERN and returns
      * a flat list of ApiOperationDescriptor objects, one per operation.
@@ -54,51 +86,76 @@ public class SwaggerLoader {
      * This method can be called at startup by SwaggerApiCatalog.
      */
     public List<ApiOperationDescriptor> loadAllOperations() {
-        List<ApiOperationDescriptor> operations = new ArrayList<>();
-
+        Resource[] resources;
         try {
             // Find all JSON files under /swagger on the classpath
-            Resource[] resources = resourceResolver.getResources(SWAGGER_LOCATION_PATTERN);
+            resources = resourceResolver.getResources(SWAGGER_LOCATION_PATTERN);
+        } catch (IOException e) {
+            // In a real app, replace with proper logging (e.g., SLF4J logger)
+            System.err.println("Failed to load Swagger resources: " + e.getMessage());
+            return new ArrayList<>();
+        }
 
-            for (Resource resource : resources) {
-                String sourceName = resource.getFilename(); // e.g. "index-levels.json"
-                if (sourceName == null) {
-                    sourceName = "unknown-source.json";
-                }
+        // Each spec file is independent, so read + parse them in parallel —
+        // parsing is the expensive part and scales with the number of files.
+        // The stream collect preserves encounter order, so the resulting
+        // operation list stays deterministic.
+        return Arrays.stream(resources)
+                .parallel()
+                .map(this::loadOperationsFromResource)
+                .flatMap(List::stream)
+                .collect(Collectors.toList());
+    }
+
+    /**
+     * Loads all operations from a single swagger resource.
+     * Failures are contained per file: a broken spec logs an error and
+     * contributes no operations instead of aborting the whole load.
+     */
+    private List<ApiOperationDescriptor> loadOperationsFromResource(Resource resource) {
+        String sourceName = resource.getFilename(); // e.g. "index-levels.json"
+        if (sourceName == null) {
+            sourceName = "unknown-source.json";
+        }
 
-                // Read the JSON content of the swagger file
-                String jsonContent = readResourceToString(resource);
+        try {
+            // Read the JSON content of the swagger file
+            String jsonContent = readResourceToString(resource);
 
-                // Parse the JSON content into an OpenAPI model
-                OpenAPI openAPI = parseOpenApi(jsonContent, sourceName);
+            // Parse the JSON content into an OpenAPI model
+            OpenAPI openAPI = parseOpenApi(jsonContent, sourceName);
 
-                if (openAPI == null || openAPI.getPaths() == null) {
-                    // If parsing failed or there are no paths, skip this file.
-                    continue;
-                }
+            if (openAPI == null || openAPI.getPaths() == null) {
+                // If parsing failed or there are no paths, skip this file.
+                return List.of();
+            }
 
-                // For each path + HTTP method, create an ApiOperationDescriptor
-                for (Map.Entry<String, PathItem> pathEntry : openAPI.getPaths().entrySet()) {
-                    String path = pathEntry.getKey();
-                    PathItem pathItem = pathEntry.getValue();
+            List<ApiOperationDescriptor> operations = new ArrayList<>();
 
-                    // Path-level parameters (apply to all methods under this path)
-                    List<Parameter> pathLevelParams = pathItem.getParameters();
+            // For each path + HTTP method, create an ApiOperationDescriptor
+            for (Map.Entry<String, PathItem> pathEntry : openAPI.getPaths().entrySet()) {
+                String path = pathEntry.getKey();
+                PathItem pathItem = pathEntry.getValue();
 
-                    // Check each supported HTTP method on this path
-                    addOperationIfPresent(operations, path, pathItem.getGet(), "GET", pathLevelParams, sourceName);
-                    addOperationIfPresent(operations, path, pathItem.getPost(), "POST", pathLevelParams, sourceName);
-                    addOperationIfPresent(operations, path, pathItem.getPut(), "PUT", pathLevelParams, sourceName);
-                    addOperationIfPresent(operations, path, pathItem.getDelete(), "DELETE", pathLevelParams, sourceName);
-                    addOperationIfPresent(operations, path, pathItem.getPatch(), "PATCH", pathLevelParams, sourceName);
+                // Path-level parameters (apply to all methods under this path)
+                List<Parameter> pathLevelParams = pathItem.getParameters();
+
+                // Single pass over the methods actually defined on this path,
+                // instead of probing all five method getters individually
+                for (Map.Entry<PathItem.HttpMethod, Operation> opEntry : pathItem.readOperationsMap().entrySet()) {
+                    PathItem.HttpMethod method = opEntry.getKey();
+                    if (!SUPPORTED_METHODS.contains(method)) {
+                        continue;
+                    }
+                    addOperationIfPresent(operations, path, opEntry.getValue(), method.name(), pathLevelParams, sourceName);
                 }
             }
+
+            return operations;
         } catch (IOException e) {
-            // In a real app, replace with proper logging (e.g., SLF4J logger)
-            System.err.println("Failed to load Swagger resources: " + e.getMessage());
+            System.err.println("Failed to load Swagger resource " + sourceName + ": " + e.getMessage());
+            return List.of();
         }
-
-        return operations;
     }
 
     /**
@@ -115,13 +172,7 @@ public class SwaggerLoader {
      * Parses a JSON Swagger/OpenAPI string into an OpenAPI model using swagger-parser.
      */
     private OpenAPI parseOpenApi(String jsonContent, String sourceName) {
-        OpenAPIV3Parser parser = new OpenAPIV3Parser();
-
-        ParseOptions options = new ParseOptions();
-        options.setResolve(true);          // Resolve $refs if any
-        options.setResolveFully(true);     // Resolve fully where possible
-
-        SwaggerParseResult result = parser.readContents(jsonContent, null, options);
+        SwaggerParseResult result = openApiParser.readContents(jsonContent, null, parseOptions);
 
         if (result == null) {
             System.err.println("Failed to parse OpenAPI for source: " + sourceName);
@@ -168,14 +219,14 @@ public class SwaggerLoader {
         String summary = operation.getSummary();
         String description = operation.getDescription();
 
-        // Combine path-level and operation-level parameters
+        // Combine path-level and operation-level parameters, partitioning by
+        // location in the same pass — we are already visiting each element,
+        // so downstream consumers get the path/query views for free.
         List<ApiParameterDescriptor> parameterDescriptors = new ArrayList<>();
-        if (pathLevelParams != null) {
-            pathLevelParams.forEach(p -> parameterDescriptors.add(toParameterDescriptor(p)));
-        }
-        if (operation.getParameters() != null) {
-            operation.getParameters().forEach(p -> parameterDescriptors.add(toParameterDescriptor(p)));
-        }
+        List<ApiParameterDescriptor> pathParameters = new ArrayList<>();
+        List<ApiParameterDescriptor> queryParameters = new ArrayList<>();
+        collectParameters(pathLevelParams, parameterDescriptors, pathParameters, queryParameters);
+        collectParameters(operation.getParameters(), parameterDescriptors, pathParameters, queryParameters);
 
         boolean hasRequestBody = operation.getRequestBody() != null;
         String requestBodySummary = null;
@@ -184,25 +235,58 @@ public class SwaggerLoader {
             requestBodySummary = operation.getRequestBody().getDescription();
         }
 
+        // The parsed model is ours alone, so an immutable snapshot is enough —
+        // no need for a mutable defensive copy.
         List<String> tags = (operation.getTags() != null)
-                ? new ArrayList<>(operation.getTags())
-                : new ArrayList<>();
-
-        ApiOperationDescriptor dto = new ApiOperationDescriptor();
-        dto.setId(operationId);
-        dto.setHttpMethod(httpMethod);
-        dto.setPath(path);
-        dto.setSummary(summary);
-        dto.setDescription(description);
-        dto.setTags(tags);
-        dto.setParameters(parameterDescriptors);
-        dto.setHasRequestBody(hasRequestBody);
-        dto.setRequestBodySummary(requestBodySummary);
-        dto.setSourceName(sourceName);
+                ? List.copyOf(operation.getTags())
+                : List.of();
+
+        ApiOperationDescriptor dto = ApiOperationDescriptor.builder()
+                .id(operationId)
+                .httpMethod(httpMethod)
+                .path(path)
+                .summary(summary)
+                .description(description)
+                .tags(tags)
+                .parameters(parameterDescriptors)
+                .pathParameters(List.copyOf(pathParameters))
+                .queryParameters(List.copyOf(queryParameters))
+                .hasRequestBody(hasRequestBody)
+                .requestBodySummary(requestBodySummary)
+                .sourceName(sourceName)
+                .build();
 
         operations.add(dto);
     }
 
+    /**
+     * Converts the given OpenAPI parameters (may be null) into descriptors,
+     * appending each to the full list and to its path/query bucket.
+     */
+    private void collectParameters(List<Parameter> params,
+                                   List<ApiParameterDescriptor> all,
+                                   List<ApiParameterDescriptor> pathParameters,
+                                   List<ApiParameterDescriptor> queryParameters) {
+        if (params == null) {
+            return;
+        }
+
+        for (Parameter p : params) {
+            ApiParameterDescriptor descriptor = toParameterDescriptor(p);
+            if (descriptor == null) {
+                continue;
+            }
+
+            all.add(descriptor);
+
+            if (descriptor.getLocation() == ApiParameterLocation.PATH) {
+                pathParameters.add(descriptor);
+            } else if (descriptor.getLocation() == ApiParameterLocation.QUERY) {
+                queryParameters.add(descriptor);
+            }
+        }
+    }
+
     /**
      * Converts an OpenAPI Parameter into our simpler ApiParameterDescriptor.
      * We ignore some advanced schema details to keep this focused on the browse use case.
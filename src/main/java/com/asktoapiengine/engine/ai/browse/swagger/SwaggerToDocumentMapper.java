@@ -6,6 +6,7 @@ import org.springframework.stereotype.Component;
 import java.util.HashMap;
 import java.util.List;
 import java.util.Map;
+import java.util.concurrent.ConcurrentHashMap;
 
 /**
  * SwaggerToDocumentMapper converts ApiOperationDescriptor objects
@@ -25,6 +26,15 @@ import java.util.Map;
 @Component
 public class SwaggerToDocumentMapper {
 
+    /**
+     * Cache of the rendered content text per operation, keyed by operation ID.
+     *
+     * Descriptors are immutable after the catalog is built, so the content
+     * for a given operation never changes — re-indexing (e.g., on restartable
+     * dev reloads) reuses the rendered text instead of rebuilding it.
+     */
+    private final Map<String, String> contentCache = new ConcurrentHashMap<>();
+
     /**
      * Convert a single ApiOperationDescriptor into a Spring AI Document.
      *
@@ -36,9 +46,11 @@ public class SwaggerToDocumentMapper {
             return null;
         }
 
-        // 1. Build the "content" text for this document.
+        // 1. Build the "content" text for this document (memoized per operation).
         //    This is what the embedding model will "read" and index.
-        String content = buildContentText(op);
+        String content = (op.getId() != null)
+                ? contentCache.computeIfAbsent(op.getId(), id -> buildContentText(op))
+                : buildContentText(op);
 
         // 2. Build metadata so we can map back from Documents to operations later.
         Map<String, Object> metadata = buildMetadata(op);
@@ -92,7 +104,13 @@ public class SwaggerToDocumentMapper {
         // Parameters
         if (op.getParameters() != null && !op.getParameters().isEmpty()) {
             sb.append("Parameters:\n");
-            op.getParameters().forEach(param -> {
+            for (ApiParameterDescriptor param : op.getParameters()) {
+                // Read each field once into a local instead of repeating
+                // accessor calls across the conditionals below
+                String type = param.getType();
+                String description = param.getDescription();
+                String example = param.getExample();
+
                 sb.append("  - ")
                         .append(param.getName())
                         .append(" (").append(param.getLocation()).append(")");
@@ -103,20 +121,20 @@ public class SwaggerToDocumentMapper {
                     sb.append(" [optional]");
                 }
 
-                if (param.getType() != null) {
-                    sb.append(" type=").append(param.getType());
+                if (type != null) {
+                    sb.append(" type=").append(type);
                 }
 
-                if (param.getDescription() != null && !param.getDescription().isBlank()) {
-                    sb.append(" - ").append(param.getDescription());
+                if (description != null && !description.isBlank()) {
+                    sb.append(" - ").append(description);
                 }
 
-                if (param.getExample() != null && !param.getExample().isBlank()) {
-                    sb.append(" (example: ").append(param.getExample()).append(")");
+                if (example != null && !example.isBlank()) {
+                    sb.append(" (example: ").append(example).append(")");
                 }
 
                 sb.append("\n");
-            });
+            }
         }
 
         // Request body
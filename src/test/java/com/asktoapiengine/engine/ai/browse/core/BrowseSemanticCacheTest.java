@@ -0,0 +1,89 @@
+package com.asktoapiengine.engine.ai.browse.core;
+
+import com.asktoapiengine.engine.ai.browse.config.AiBrowseProperties;
+import org.junit.jupiter.api.BeforeEach;
+import org.junit.jupiter.api.Test;
+import org.springframework.ai.embedding.EmbeddingModel;
+
+import static org.assertj.core.api.Assertions.assertThat;
+import static org.assertj.core.api.Assertions.within;
+import static org.mockito.Mockito.mock;
+import static org.mockito.Mockito.when;
+
+/**
+ * Unit tests for BrowseSemanticCache: similarity threshold, TTL expiry
+ * and LRU eviction. The embedding model is mocked — the cache's logic
+ * works on plain (pre-normalized) vectors.
+ */
+class BrowseSemanticCacheTest {
+
+	private EmbeddingModel embeddingModel;
+	private AiBrowseProperties properties;
+	private BrowseSemanticCache cache;
+
+	@BeforeEach
+	void setUp() {
+		embeddingModel = mock(EmbeddingModel.class);
+		properties = new AiBrowseProperties();
+		cache = new BrowseSemanticCache(embeddingModel, properties);
+	}
+
+	@Test
+	void embedQueryNormalizesToUnitLength() {
+		when(embeddingModel.embed("query")).thenReturn(new float[] { 3f, 4f });
+
+		float[] vector = cache.embedQuery("query");
+
+		assertThat(vector[0]).isCloseTo(0.6f, within(1e-6f));
+		assertThat(vector[1]).isCloseTo(0.8f, within(1e-6f));
+	}
+
+	@Test
+	void findSimilarHitsAboveThreshold() {
+		cache.store("get NIFTY levels", new float[] { 1f, 0f, 0f }, "Use GET /indices/{id}/levels");
+
+		// Identical vector → cosine similarity 1.0 ≥ threshold (0.95)
+		assertThat(cache.findSimilar(new float[] { 1f, 0f, 0f }))
+				.contains("Use GET /indices/{id}/levels");
+	}
+
+	@Test
+	void findSimilarMissesBelowThreshold() {
+		cache.store("get NIFTY levels", new float[] { 1f, 0f, 0f }, "Use GET /indices/{id}/levels");
+
+		// Dot product 0.6 < threshold (0.95) → miss
+		assertThat(cache.findSimilar(new float[] { 0.6f, 0.8f, 0f })).isEmpty();
+	}
+
+	@Test
+	void expiredEntriesAreNotReturned() throws InterruptedException {
+		properties.getCache().setTtlSeconds(0);
+
+		cache.store("query", new float[] { 1f, 0f, 0f }, "answer");
+		Thread.sleep(5); // let the zero-TTL entry age past its lifetime
+
+		assertThat(cache.findSimilar(new float[] { 1f, 0f, 0f })).isEmpty();
+	}
+
+	@Test
+	void evictsLeastRecentlyUsedEntryBeyondMaxSize() {
+		properties.getCache().setMaxSize(2);
+
+		float[] vectorA = { 1f, 0f, 0f };
+		float[] vectorB = { 0f, 1f, 0f };
+		float[] vectorC = { 0f, 0f, 1f };
+
+		cache.store("query A", vectorA, "answer A");
+		cache.store("query B", vectorB, "answer B");
+
+		// Touch A so B becomes the least recently used entry
+		assertThat(cache.findSimilar(vectorA)).contains("answer A");
+
+		// Storing C exceeds maxSize → B is evicted, A survives
+		cache.store("query C", vectorC, "answer C");
+
+		assertThat(cache.findSimilar(vectorB)).isEmpty();
+		assertThat(cache.findSimilar(vectorA)).contains("answer A");
+		assertThat(cache.findSimilar(vectorC)).contains("answer C");
+	}
+}
@@ -0,0 +1,112 @@
+package com.asktoapiengine.engine.ai.browse.core;
+
+import com.asktoapiengine.engine.ai.browse.llm.BrowseWebClientLlmService;
+import com.asktoapiengine.engine.ai.browse.rag.SwaggerRetrievalService;
+import com.asktoapiengine.engine.ai.browse.swagger.ApiOperationDescriptor;
+import org.junit.jupiter.api.BeforeEach;
+import org.junit.jupiter.api.Test;
+import reactor.core.publisher.Flux;
+
+import java.util.List;
+import java.util.Optional;
+
+import static org.assertj.core.api.Assertions.assertThat;
+import static org.mockito.ArgumentMatchers.any;
+import static org.mockito.ArgumentMatchers.anyList;
+import static org.mockito.ArgumentMatchers.anyString;
+import static org.mockito.Mockito.mock;
+import static org.mockito.Mockito.never;
+import static org.mockito.Mockito.verify;
+import static org.mockito.Mockito.when;
+
+/**
+ * Unit tests for BrowseService, focused on the interaction with the
+ * semantic cache: fresh answers get stored, LLM failures do NOT — a
+ * transient outage must never be cached and replayed to similar queries.
+ */
+class BrowseServiceTest {
+
+	private static final String QUERY = "How do I get index levels?";
+	private static final float[] QUERY_VECTOR = { 1f, 0f, 0f };
+
+	private static final ApiOperationDescriptor OPERATION = ApiOperationDescriptor.builder()
+			.id("getIndexLevels")
+			.httpMethod("GET")
+			.path("/indices/{indexId}/levels")
+			.build();
+
+	private SwaggerRetrievalService retrievalService;
+	private BrowseWebClientLlmService llmService;
+	private BrowseSemanticCache semanticCache;
+	private BrowseService browseService;
+
+	@BeforeEach
+	void setUp() {
+		retrievalService = mock(SwaggerRetrievalService.class);
+		llmService = mock(BrowseWebClientLlmService.class);
+		semanticCache = mock(BrowseSemanticCache.class);
+		browseService = new BrowseService(retrievalService, llmService, semanticCache);
+
+		when(semanticCache.embedQuery(QUERY)).thenReturn(QUERY_VECTOR);
+		when(semanticCache.findSimilar(QUERY_VECTOR)).thenReturn(Optional.empty());
+		when(retrievalService.retrieveRelevantOperations(QUERY)).thenReturn(List.of(OPERATION));
+	}
+
+	@Test
+	void successfulAnswerIsStoredInSemanticCache() {
+		when(llmService.getBrowseAnswer(QUERY, List.of(OPERATION))).thenReturn("Use GET /indices/{indexId}/levels");
+
+		String answer = browseService.handleBrowseQuery(QUERY);
+
+		assertThat(answer).isEqualTo("Use GET /indices/{indexId}/levels");
+		verify(semanticCache).store(QUERY, QUERY_VECTOR, "Use GET /indices/{indexId}/levels");
+	}
+
+	@Test
+	void llmFailureReturnsFallbackAndIsNotCached() {
+		when(llmService.getBrowseAnswer(QUERY, List.of(OPERATION)))
+				.thenThrow(new IllegalStateException("OpenAI unavailable"));
+
+		String answer = browseService.handleBrowseQuery(QUERY);
+
+		assertThat(answer).startsWith("Sorry").contains("OpenAI unavailable");
+		verify(semanticCache, never()).store(anyString(), any(float[].class), anyString());
+	}
+
+	@Test
+	void noCandidateOperationsSkipsLlmAndCache() {
+		when(retrievalService.retrieveRelevantOperations(QUERY)).thenReturn(List.of());
+
+		String answer = browseService.handleBrowseQuery(QUERY);
+
+		assertThat(answer).contains("could not find any API endpoints");
+		verify(llmService, never()).getBrowseAnswer(anyString(), anyList());
+		verify(semanticCache, never()).store(anyString(), any(float[].class), anyString());
+	}
+
+	@Test
+	void completedStreamIsStoredInSemanticCache() {
+		when(llmService.streamBrowseAnswer(QUERY, List.of(OPERATION)))
+				.thenReturn(Flux.just("Use GET ", "/indices/{indexId}/levels"));
+
+		List<String> chunks = browseService.handleBrowseQueryStream(QUERY).collectList().block();
+
+		assertThat(chunks).containsExactly("Use GET ", "/indices/{indexId}/levels");
+		verify(semanticCache).store(QUERY, QUERY_VECTOR, "Use GET /indices/{indexId}/levels");
+	}
+
+	@Test
+	void failedStreamEmitsFallbackAndIsNotCached() {
+		when(llmService.streamBrowseAnswer(QUERY, List.of(OPERATION)))
+				.thenReturn(Flux.concat(
+						Flux.just("partial answer "),
+						Flux.error(new IllegalStateException("stream timeout"))));
+
+		List<String> chunks = browseService.handleBrowseQueryStream(QUERY).collectList().block();
+
+		assertThat(chunks).hasSize(2);
+		assertThat(chunks.get(0)).isEqualTo("partial answer ");
+		assertThat(chunks.get(1)).startsWith("Sorry").contains("stream timeout");
+		verify(semanticCache, never()).store(anyString(), any(float[].class), anyString());
+	}
+}